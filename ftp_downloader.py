@@ -11,15 +11,783 @@ import os
 import sys
 import threading
 import queue
+import collections
 import time
+import errno
+import select
 import shutil
+import random
+import itertools
+import concurrent.futures
 import re
+import socket
+import ssl
 import ftplib
 import ftputil
 from pathlib import Path
 from urllib.parse import quote
 
 
+# Progress messages that replace the previous log line when it has the same
+# prefix, so scan counters don't flood the log
+LOG_COALESCE_PREFIXES = ("Found ", "Discovered ")
+
+# Minimum seconds between "Discovered N files" lines while scanners run
+DISCOVER_LOG_INTERVAL = 0.5
+
+# Threads that index the local directory before a download; the per-file
+# stat calls overlap, which matters on network-mounted targets
+LOCAL_INDEX_WORKERS = 16
+
+# Lines kept in the log widget; older lines are dropped from the top
+LOG_MAX_LINES = 2000
+
+# Number of discovered files handed to the treeview per Tk callback
+TREEVIEW_BATCH_SIZE = 500
+
+# Delay before queued treeview rows are inserted, so scanners fill a batch
+TREEVIEW_DRAIN_MS = 150
+
+# Rows kept in the file treeview. Further pending files wait off-screen and
+# are inserted as finished rows are removed, so Tk never holds the whole scan
+TREEVIEW_MAX_ROWS = 2000
+
+# Interval for polling the stats-changed event from the Tk thread
+PROGRESS_POLL_MS = 100
+
+# Poll interval for update_progress while no worker or scanner changed the stats
+PROGRESS_IDLE_POLL_MS = 1000
+
+# Seconds of (time, bytes) samples the displayed speed is averaged over
+SPEED_WINDOW = 2.0
+
+# Text of the Statistics line, filled by update_progress
+STATS_TEMPLATE = ("Files: {total} | Total Size: {total_size} | Progress: {progress} | ETA: {eta} | "
+                  "Completed: {completed} | Pending: {pending} | Failed: {failed} | Speed: {speed}")
+
+# Max worker status events applied to the treeview per drain tick
+STATUS_DRAIN_LIMIT = 500
+
+# Kernel socket buffer size for FTP connections, large enough to keep
+# a single transfer from being capped by the TCP window on high-latency links
+SOCKET_BUFFER_SIZE = 4 << 20
+
+# Larger kernel buffer for data connections, which carry the file contents
+DATA_SOCKET_BUFFER_SIZE = 8 << 20
+
+# Stack size for worker and scanner threads. They spend nearly all their time
+# blocked on sockets, so the platform default (often 8 MB) is mostly wasted
+IO_THREAD_STACK_SIZE = 1 << 20
+
+# Size of the receive buffer each worker reuses for file transfers. Large
+# enough that a burst from the 4 MB socket buffer drains in few Python-level
+# recv_into/write iterations
+TRANSFER_BUFFER_SIZE = 256 * 1024
+
+# Linux can move plain (non-TLS) transfers socket -> pipe -> file with
+# os.splice, so the data never passes through a Python buffer
+SPLICE_AVAILABLE = hasattr(os, 'splice')
+
+# Capacity requested for each worker's splice pipe. One splice pair moves up
+# to this much, so a bigger pipe means fewer syscalls per file (1 MB is the
+# default unprivileged limit in /proc/sys/fs/pipe-max-size)
+SPLICE_PIPE_SIZE = 1 << 20
+
+# Downloaded files at least this big are flushed and dropped from the page
+# cache once written, so a large mirror doesn't evict everything else. Smaller
+# files skip it - a flush per file would cost more than the cache it frees
+CACHE_DROP_MIN_SIZE = 64 << 20
+
+# Files are written under their name plus this suffix and renamed once the
+# server confirms the transfer, so a download cut short (quit, crash) never
+# leaves a file under the final name that a later run would skip as present
+PARTIAL_SUFFIX = '.part'
+
+# Files at least this big are fetched over SEGMENT_STREAMS data connections at
+# once, each RETR-ing its own byte range from a REST offset, so one transfer
+# isn't capped by a single TCP window on high-latency links
+SEGMENTED_MIN_SIZE = 16 << 20
+SEGMENT_STREAMS = 4
+
+# Extra logins all workers' segmented downloads may hold at once - servers
+# commonly limit connections per client IP, and every worker already has one
+SEGMENT_EXTRA_STREAMS_MAX = 4
+
+# Seconds a directory listing from a download's scan is reused, so a retry or
+# restart soon after doesn't list the whole tree again
+LISTING_CACHE_TTL = 60.0
+
+# Seconds stop_download waits, in total, for the workers to exit before
+# forcing their control connections shut
+STOP_JOIN_TIMEOUT = 2.0
+
+# Errors that mean the FTP connection itself is unusable (reset, timeout,
+# out-of-sync replies) rather than the file. Of the 4xx replies only 421
+# "service not available" counts - see is_connection_error
+CONNECTION_ERRORS = (ConnectionError, TimeoutError, EOFError, ftplib.error_reply, ftplib.error_proto)
+
+# Seconds Test Connection waits for the server before giving up, so a server
+# that drops its pipelined probe commands can't hang the test
+TEST_CONNECTION_TIMEOUT = 30
+
+# Connect attempts a worker makes after losing its connection, the first
+# after RECONNECT_BACKOFF seconds and each later one after twice as long
+RECONNECT_ATTEMPTS = 3
+RECONNECT_BACKOFF = 1.0
+
+# Logged-in connections kept after Test Connection or Scan, for the next scan's
+# scanners to reuse instead of repeating the connect/TLS/login round-trips
+IDLE_FTP_MAX = 32
+
+# Number of independently locked buckets in a ShardedPathSet
+PATH_SET_SHARDS = 16
+
+
+def _parse_size_str(size):
+    """Parse a size string from MLSD/LIST output, 0 if missing or 'Unknown'"""
+    if not size or size == 'Unknown':
+        return 0
+    try:
+        return int(size)
+    except ValueError:
+        return 0
+
+
+def _parse_size_unknown(size):
+    """Fallback size parser for unsupported types"""
+    return 0
+
+
+# Size parsers keyed by type(size) - the type is fixed per listing source,
+# so a dict lookup replaces the isinstance() ladder in the scan loops
+_SIZE_PARSERS = {
+    int: int,
+    str: _parse_size_str,
+    float: int,
+    type(None): _parse_size_unknown,
+}
+
+
+# (threshold, divisor, suffix) for format_speed, largest unit first
+_SPEED_UNITS = (
+    (1 << 30, float(1 << 30), "GB/s"),
+    (1 << 20, float(1 << 20), "MB/s"),
+    (1 << 10, float(1 << 10), "KB/s"),
+)
+
+
+def is_connection_error(error):
+    """Whether error means the control connection is gone, not just this file
+    
+    Other 4xx replies (450 busy, 451 local error, 425 no data connection) are
+    per-file failures on a connection that still works.
+    """
+    if isinstance(error, ftplib.error_temp):
+        return str(error).startswith('421')
+    return isinstance(error, CONNECTION_ERRORS)
+
+
+def format_speed(bytes_per_sec):
+    """Format a transfer rate as B/s, KB/s, MB/s or GB/s"""
+    for threshold, divisor, suffix in _SPEED_UNITS:
+        if bytes_per_sec >= threshold:
+            return f"{bytes_per_sec / divisor:.1f} {suffix}"
+    return f"{bytes_per_sec:.0f} B/s"
+
+
+def tune_ftp_socket(sock, nodelay=False, buffer_size=SOCKET_BUFFER_SIZE):
+    """Enlarge socket buffers and enable keepalive (and optionally TCP_NODELAY)"""
+    options = [
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if nodelay:
+        # Small command/reply exchanges shouldn't wait on Nagle or delayed ACKs
+        options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+            options.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass  # Option not supported on this platform
+
+
+class _TunedSocketsMixin:
+    """Apply tune_ftp_socket() to the control connection and every data connection"""
+    maxline = 1 << 20  # ftplib's 8 KiB default rejects very long MLSD/LIST lines
+    _transfer_type = None  # Last TYPE command the server accepted on this connection
+    
+    def connect(self, *args, **kwargs):
+        welcome = super().connect(*args, **kwargs)
+        tune_ftp_socket(self.sock, nodelay=True)
+        return welcome
+    
+    # retrlines() and retrbinary() send TYPE before every transfer; skip the
+    # round-trip when the connection is already in that mode
+    def sendcmd(self, cmd):
+        if cmd.startswith('TYPE '):
+            if cmd == self._transfer_type:
+                return '200 Type already set'
+            resp = super().sendcmd(cmd)
+            self._transfer_type = cmd
+            return resp
+        return super().sendcmd(cmd)
+    
+    def voidcmd(self, cmd):
+        if cmd.startswith('TYPE '):
+            if cmd == self._transfer_type:
+                return '200 Type already set'
+            resp = super().voidcmd(cmd)
+            self._transfer_type = cmd
+            return resp
+        return super().voidcmd(cmd)
+    
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        tune_ftp_socket(conn, buffer_size=DATA_SOCKET_BUFFER_SIZE)
+        return conn, size
+
+
+class TunedFTP(_TunedSocketsMixin, ftplib.FTP):
+    """ftplib.FTP with tuned control and data sockets"""
+
+
+class TunedFTP_TLS(_TunedSocketsMixin, ftplib.FTP_TLS):
+    """ftplib.FTP_TLS with tuned sockets and TLS session reuse on control and data connections"""
+    # One context for every connection (ftplib's default settings): a TLS
+    # session can only be resumed through the context that created it
+    _shared_context = ssl._create_stdlib_context(ftplib.FTP_TLS.ssl_version)
+    # (host, port) -> TLS session of the last control connection that logged in
+    _control_sessions = {}
+    
+    def __init__(self, *args, **kwargs):
+        if kwargs.get('context') is None:
+            kwargs['context'] = self._shared_context
+        super().__init__(*args, **kwargs)
+    
+    def auth(self):
+        # Same as FTP_TLS.auth, but offering the last control session to the
+        # server, so a new connection resumes it instead of a full handshake
+        if isinstance(self.sock, ssl.SSLSocket):
+            raise ValueError("Already using TLS")
+        resp = self.voidcmd('AUTH TLS')
+        session = self._control_sessions.get((self.host, self.port))
+        if session is not None and self.context is not self._shared_context:
+            session = None  # Caller supplied its own context
+        self.sock = self.context.wrap_socket(self.sock, server_hostname=self.host, session=session)
+        self.file = self.sock.makefile(mode='r', encoding=self.encoding)
+        return resp
+    
+    def login(self, *args, **kwargs):
+        resp = super().login(*args, **kwargs)
+        # Taken after login, once TLS 1.3 servers have sent their session ticket
+        if isinstance(self.sock, ssl.SSLSocket) and self.sock.session is not None:
+            self._control_sessions[(self.host, self.port)] = self.sock.session
+        return resp
+    
+    def ntransfercmd(self, cmd, rest=None):
+        # Same as FTP_TLS.ntransfercmd, but the data connection resumes the
+        # control connection's TLS session instead of a full handshake per
+        # transfer (and servers requiring session reuse accept it)
+        conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
+        tune_ftp_socket(conn, buffer_size=DATA_SOCKET_BUFFER_SIZE)
+        if self._prot_p:
+            conn = self.context.wrap_socket(conn, server_hostname=self.host,
+                                            session=self.sock.session)
+        return conn, size
+
+
+class ShardedPathSet:
+    """Set of remote paths split across independently locked shards
+    
+    Workers touching different paths rarely contend, unlike a single set
+    guarded by stats['lock'].
+    """
+    
+    def __init__(self, shards=PATH_SET_SHARDS):
+        self._shards = [(set(), threading.Lock()) for _ in range(shards)]
+    
+    def _shard(self, path):
+        return self._shards[hash(path) % len(self._shards)]
+    
+    def add(self, path):
+        paths, lock = self._shard(path)
+        with lock:
+            paths.add(path)
+    
+    def add_if_absent(self, path):
+        """Add path, returning False if it was already present"""
+        paths, lock = self._shard(path)
+        if path in paths:
+            return False  # Already present, no need to lock
+        with lock:
+            if path in paths:
+                return False
+            paths.add(path)
+            return True
+    
+    def discard(self, path):
+        paths, lock = self._shard(path)
+        with lock:
+            paths.discard(path)
+    
+    def clear(self):
+        for paths, lock in self._shards:
+            with lock:
+                paths.clear()
+    
+    def __contains__(self, path):
+        # A single set lookup is atomic, no need to take the shard lock
+        return path in self._shard(path)[0]
+    
+    def __len__(self):
+        return sum(len(paths) for paths, _ in self._shards)
+    
+    def __iter__(self):
+        snapshot = []
+        for paths, lock in self._shards:
+            with lock:
+                snapshot.extend(paths)
+        return iter(snapshot)
+
+
+# Marker returned by TaskQueue._take when no deque had a task
+_NO_TASK = object()
+
+
+class TaskQueue:
+    """Download task queue with one deque per worker and work stealing
+    
+    Producers spread tasks round-robin over the worker deques. Each worker pops
+    from its own deque and steals from a random other one when it runs dry.
+    deque append/pop/popleft are atomic, so no lock is taken per task; the
+    condition is only entered to park a worker that found nothing. None (the
+    poison pill) is counted rather than queued, and is only handed out once no
+    task is left. Supports the subset of the queue.Queue API the downloader uses.
+    """
+    
+    def __init__(self, num_workers=1):
+        self._cond = threading.Condition()  # Only for parking idle workers
+        self._waiting = 0
+        self._stops = 0
+        self._deques = []
+        self.resize(num_workers)
+    
+    def resize(self, num_workers):
+        """Spread pending tasks over num_workers deques and drop stale pills"""
+        pending = []
+        for tasks in self._deques:
+            # popleft rather than copy + clear, so a concurrent pop can't
+            # hand out a task that is also carried over
+            try:
+                while True:
+                    pending.append(tasks.popleft())
+            except IndexError:
+                pass
+        self._deques = [collections.deque() for _ in range(max(1, num_workers))]
+        self._next = itertools.count()
+        with self._cond:
+            self._stops = 0
+        self.put_many(pending)
+    
+    def put(self, item):
+        """Queue a task, or a stop request for one worker when item is None"""
+        self.put_many((item,))
+    
+    def put_many(self, items):
+        """Queue several tasks/stop requests, waking idle workers once"""
+        stops = 0
+        deques = self._deques
+        for item in items:
+            if item is None:
+                stops += 1
+                continue
+            deques[next(self._next) % len(deques)].append(item)
+        if stops:
+            with self._cond:
+                self._stops += stops
+                self._cond.notify_all()
+        elif self._waiting:
+            with self._cond:
+                self._cond.notify_all()
+    
+    def _take(self, worker_id):
+        """Pop from the worker's own deque, else steal from another one"""
+        deques = self._deques
+        if worker_id is not None:
+            tasks = deques[worker_id % len(deques)]
+            if tasks:
+                try:
+                    return tasks.pop()
+                except IndexError:
+                    pass  # A thief took the last one
+        start = random.randrange(len(deques))
+        for i in range(len(deques)):
+            tasks = deques[(start + i) % len(deques)]
+            if tasks:
+                try:
+                    return tasks.popleft()
+                except IndexError:
+                    pass
+        return _NO_TASK
+    
+    def get(self, block=True, timeout=None, worker_id=None):
+        """Return the next task, or None once a stop was requested and no task is left
+        
+        Raises queue.Empty like queue.Queue.get when nothing arrives in time.
+        """
+        item = self._take(worker_id)
+        if item is not _NO_TASK:
+            return item
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            # Producers check _waiting after queueing, so registering before
+            # the re-check below means a wakeup can't be missed
+            self._waiting += 1
+            try:
+                while True:
+                    item = self._take(worker_id)
+                    if item is not _NO_TASK:
+                        return item
+                    if self._stops:
+                        self._stops -= 1
+                        return None
+                    if not block:
+                        raise queue.Empty
+                    if deadline is None:
+                        self._cond.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Empty
+                        self._cond.wait(remaining)
+            finally:
+                self._waiting -= 1
+    
+    def task_done(self):
+        """No-op, kept for queue.Queue compatibility (nothing joins this queue)"""
+    
+    def qsize(self):
+        """Approximate task count, for diagnostics only"""
+        return sum(len(tasks) for tasks in self._deques)
+    
+    def empty(self):
+        # Stops at the first non-empty deque instead of summing them all
+        return not any(self._deques)
+
+
+class DirectoryQueue:
+    """Remote directories waiting to be listed, shared by the scanner threads
+    
+    Each scanner thread gets its own deque: the subdirectories it finds go on
+    the right end and it pops the newest one back, so it keeps walking the
+    subtree whose listings it just fetched. A scanner whose deque is empty
+    steals the oldest directory from a random other deque. deque pops are
+    atomic, so taking work never touches a mutex. The lock only guards the
+    count of directories queued or still being listed, which tells idle
+    scanners when the whole tree is done; they park on an Event meanwhile.
+    """
+    
+    def __init__(self, root, num_scanners=1):
+        self._deques = [collections.deque() for _ in range(max(1, num_scanners))]
+        self._deques[0].append(root)
+        self._ids = itertools.count()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._unfinished = 1
+        self._changed = threading.Event()
+    
+    def _own(self):
+        """The calling scanner thread's deque, assigned on first use"""
+        own = getattr(self._local, 'deque', None)
+        if own is None:
+            own = self._local.deque = self._deques[next(self._ids) % len(self._deques)]
+        return own
+    
+    def put(self, path):
+        self.put_many((path,))
+    
+    def put_many(self, paths):
+        """Queue subdirectories - call before task_done() for their parent"""
+        with self._lock:
+            self._unfinished += len(paths)
+            self._own().extend(paths)
+        self._changed.set()
+    
+    def _take(self):
+        """Pop the newest directory from our deque, else steal the oldest from another"""
+        try:
+            return self._own().pop()
+        except IndexError:
+            pass
+        deques = self._deques
+        start = random.randrange(len(deques))
+        for i in range(len(deques)):
+            try:
+                return deques[(start + i) % len(deques)].popleft()
+            except IndexError:
+                pass
+        return None
+    
+    def get(self):
+        """Return the next directory, or None once every queued one has been listed"""
+        while True:
+            path = self._take()
+            if path is not None:
+                return path
+            with self._lock:
+                if self._unfinished == 0:
+                    return None
+                self._changed.clear()
+            # Re-check after clearing, so a put in between isn't slept through
+            if not any(self._deques):
+                self._changed.wait(0.1)
+    
+    def task_done(self):
+        """Mark a directory returned by get() as listed"""
+        with self._lock:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                self._changed.set()  # Release the idle scanners
+    
+    def clear(self):
+        """Drop the directories not yet taken by a scanner"""
+        dropped = 0
+        for dirs in self._deques:
+            # Pop one at a time - scanners may be taking from the same deque
+            while True:
+                try:
+                    dirs.pop()
+                except IndexError:
+                    break
+                dropped += 1
+        with self._lock:
+            self._unfinished -= dropped
+            if self._unfinished == 0:
+                self._changed.set()
+
+
+def _local_size(path):
+    """Size of a local file with a single stat call, or -1 if it doesn't exist"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
+
+
+def _scan_local_dir(rel_dir, path):
+    """Sizes of the files directly inside one local directory, and its subdirectories"""
+    files = {}
+    subdirs = []
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return files, subdirs
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((f"{rel_dir}{entry.name}/", entry.path))
+                else:
+                    files[rel_dir + entry.name] = entry.stat().st_size
+            except OSError:
+                pass  # Vanished or unreadable - treated as missing
+    return files, subdirs
+
+
+def build_local_index(local_dir):
+    """Map every file under local_dir to its size, keyed by '/'-separated relative path
+    
+    One scandir walk replaces an exists() + getsize() pair per remote file.
+    Directories are scanned on a thread pool, so stat calls overlap on
+    network-mounted targets.
+    """
+    index = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=LOCAL_INDEX_WORKERS) as executor:
+        pending = {executor.submit(_scan_local_dir, '', local_dir)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                index.update(files)
+                for rel_dir, path in subdirs:
+                    pending.add(executor.submit(_scan_local_dir, rel_dir, path))
+    return index
+
+
+def dir_path_prefixes(remote_prefix, local_prefix):
+    """Relative and local path prefixes for the files of a '/'-terminated remote directory
+    
+    The relative prefix is '/'-separated like build_local_index's keys; the
+    local one uses os.sep. Computed once per directory, so each file's paths
+    are a single concatenation.
+    """
+    rel_prefix = remote_prefix[1:] if remote_prefix.startswith('/') else remote_prefix
+    return rel_prefix, local_prefix + rel_prefix.replace('/', os.sep)
+
+
+def start_io_thread(thread):
+    """Start an I/O-bound thread with a reduced stack reservation"""
+    try:
+        previous = threading.stack_size(IO_THREAD_STACK_SIZE)
+    except (ValueError, RuntimeError):
+        # Platform doesn't allow changing the stack size
+        thread.start()
+        return
+    try:
+        thread.start()
+    finally:
+        threading.stack_size(previous)
+
+
+def get_server_features(ftp):
+    """Return the FEAT keywords advertised by the server, probed once per connection
+    
+    When MLST is advertised, MLSD output is also trimmed to the type and size
+    facts, so listings don't carry modify/perm/unique for every entry.
+    """
+    features = getattr(ftp, '_donloader_features', None)
+    if features is None:
+        features = set()
+        try:
+            response = ftp.sendcmd('FEAT')
+            for line in response.splitlines()[1:-1]:
+                if line.strip():
+                    features.add(line.split(None, 1)[0].upper())
+        except ftplib.all_errors:
+            pass  # FEAT not supported, assume no extensions
+        if 'MLST' in features:
+            try:
+                ftp.sendcmd('OPTS MLST type;size;')
+            except ftplib.all_errors:
+                pass  # Server keeps its default facts, which still include type and size
+        ftp._donloader_features = features
+    return features
+
+
+def mlsd_entries(ftp, path):
+    """List a directory with one raw MLSD command
+    
+    Returns (name, type, size) tuples where type is lower-cased and size is an
+    int, or 'Unknown' when the server didn't send the size fact. Lines are
+    parsed as they arrive rather than collected first.
+    """
+    entries = []
+    append = entries.append
+    
+    def parse_line(line):
+        # "type=file;size=123;modify=...; name" - the facts are picked out with
+        # str.find, which beats two regex searches per line on big listings.
+        # The leading ';' lets ';type=' match the first fact too
+        facts, _, name = line.partition(' ')
+        facts = ';' + facts.lower()
+        start = facts.find(';type=')
+        if start < 0:
+            entry_type = 'file'
+        else:
+            end = facts.find(';', start + 6)
+            entry_type = facts[start + 6:end] if end >= 0 else facts[start + 6:]
+        start = facts.find(';size=')
+        size = 'Unknown'
+        if start >= 0:
+            end = facts.find(';', start + 6)
+            digits = facts[start + 6:end] if end >= 0 else facts[start + 6:]
+            if digits.isdigit():
+                size = int(digits)
+        append((name, entry_type, size))
+    
+    try:
+        ftp.retrlines(f'MLSD {path}' if path else 'MLSD', parse_line)
+    except ftplib.error_perm as e:
+        if str(e)[:3] in ('500', '502'):
+            # Advertised but not implemented - stop trying MLSD on this connection
+            get_server_features(ftp).discard('MLST')
+        raise
+    return entries
+
+
+# Unix-style LIST line: mode, links, owner, group, size, 3 date fields, name
+_LIST_LINE_RE = re.compile(r'^(.)\S*\s+\S+\s+\S+\s+\S+\s+(\d+)\s+\S+\s+\S+\s+\S+\s+(.*)$')
+
+# First characters of a LIST entry's file mode (file, dir, link, devices, pipe, socket)
+_LIST_MODE_CHARS = ('-', 'd', 'l', 'c', 'b', 'p', 's')
+
+# Recursive LIST directory header ("./sub:", "/abs/sub:"): one whitespace-free
+# token ending in ':' that doesn't start like a file mode
+_LIST_HEADER_RE = re.compile(r'([^-dlcbps\s]\S*):$')
+
+
+def list_ftp_directory(ftp, path=''):
+    """List a directory (the current one by default) as (name, facts) pairs
+    
+    Uses MLSD when the server advertises MLST, otherwise parses LIST output,
+    so servers without MLSD don't pay for a failed command per directory.
+    MLSD takes the path directly; only the LIST fallback changes directory.
+    """
+    if 'MLST' in get_server_features(ftp):
+        try:
+            return [(name, {'type': entry_type, 'size': size})
+                    for name, entry_type, size in mlsd_entries(ftp, path)
+                    if entry_type not in ('cdir', 'pdir')]
+        except ftplib.error_perm:
+            if 'MLST' in get_server_features(ftp):
+                raise
+            # MLSD refused, mlsd_entries disabled it - fall back to LIST
+    
+    if path:
+        ftp.cwd(path)
+    return list_entries(ftp)
+
+
+def parse_list_entry(line):
+    """Parse one LIST entry line into (is_dir, size, name), or None if it isn't one
+    
+    Standard 9-field lines take a single precompiled match; shorter layouts
+    fall back to splitting on whitespace.
+    """
+    m = _LIST_LINE_RE.match(line)
+    if m and m.group(1) in _LIST_MODE_CHARS:
+        mode, size, name = m.groups()
+        return mode == 'd', size, name
+    
+    # At most 8 splits - the ninth field is the whole name, spaces included
+    parts = line.split(None, 8)
+    # Entries start with a file mode such as "drwxr-xr-x" or "-rw-r--r--"
+    if len(parts) < 5 or not parts[0].startswith(_LIST_MODE_CHARS):
+        return None
+    if len(parts) == 9:
+        name = parts[8]
+    elif len(parts) >= 6:
+        # parts[4] is the size when it's numeric, otherwise part of the name
+        name = ' '.join(parts[5:]) if parts[4].isdigit() else ' '.join(parts[4:])
+    else:
+        name = parts[-1]
+    size = parts[4] if parts[4].isdigit() else 'Unknown'
+    return parts[0].startswith('d'), size, name
+
+
+def list_entries(ftp):
+    """LIST the current directory as (name, facts) pairs, skipping lines that don't match
+    
+    Like mlsd_entries, each line goes through the precompiled pattern as it
+    arrives instead of being collected and parsed afterwards.
+    """
+    items = []
+    append = items.append
+    match = _LIST_LINE_RE.match
+    
+    def parse_line(line):
+        m = match(line)
+        if m:
+            mode, size, name = m.groups()
+            append((name, {'type': 'dir' if mode == 'd' else 'file', 'size': size}))
+    
+    ftp.retrlines('LIST', parse_line)
+    return items
+
+
 def create_no_utf8_session_factory(base_class, port=21, use_passive_mode=True, encrypt_data_channel=False):
     """Create a session factory that doesn't send OPTS UTF8 ON command"""
     def session_factory(host, username, password):
@@ -37,10 +805,59 @@ def create_no_utf8_session_factory(base_class, port=21, use_passive_mode=True, e
     return session_factory
 
 
+def detach_ftp_session(ftp_host):
+    """Close an FTPHost's child sessions and return its main ftplib session for pooling
+    
+    ftputil has no public API for this, so it reads FTPHost's private _session
+    and _children (ftputil 5.x) - kept here so nothing else depends on them.
+    If they're laid out differently, the whole host is closed and None returned.
+    """
+    try:
+        session, children = ftp_host._session, ftp_host._children
+    except AttributeError:
+        try:
+            ftp_host.close()
+        except Exception:
+            pass
+        return None
+    # Child sessions were opened for file objects - close them as FTPHost.close() would
+    for child in children:
+        try:
+            child._file.close()
+            child.close()
+        except Exception:
+            pass
+    ftp_host._children = []
+    return session
+
+
+def ftp_host_sessions(ftp_host):
+    """The ftplib sessions of an FTPHost and its children ([] if ftputil's internals differ)"""
+    try:
+        return [ftp_host._session] + [child._session for child in ftp_host._children]
+    except AttributeError:
+        return []
+
+
+class DirectoryStack(list):
+    """Directories waiting to be listed by a single-threaded walk
+    
+    Has DirectoryQueue's put methods, so the scanners walk a subtree on their
+    own thread with the same code path instead of recursing.
+    """
+    put = list.append
+    put_many = list.extend
+
+
 class DownloadWorker(threading.Thread):
     """Worker thread for downloading files using ftputil (preserves timestamps)"""
+    # Shared by all workers, so segmented downloads never open more than
+    # SEGMENT_EXTRA_STREAMS_MAX connections on top of the workers' own
+    _extra_stream_slots = threading.BoundedSemaphore(SEGMENT_EXTRA_STREAMS_MAX)
+    
     def __init__(self, worker_id, download_queue, stats, host, port, 
-                 local_dir, progress_callback, status_callback, username='', password='', use_tls=False, remote_base='/'):
+                 local_dir, progress_callback, status_callback, username='', password='', use_tls=False, remote_base='/',
+                 take_connection=None, park_connection=None, log_callback=None):
         super().__init__(daemon=True)
         self.worker_id = worker_id
         self.download_queue = download_queue
@@ -48,46 +865,108 @@ class DownloadWorker(threading.Thread):
         self.host = host
         self.port = port
         self.local_dir = local_dir
+        self._created_dirs = set()  # Local directories this worker already created
         self.progress_callback = progress_callback
         self.status_callback = status_callback
         self.username = username
         self.password = password
         self.use_tls = use_tls
         self.remote_base = remote_base
+        # Optional pool hooks: take_connection() returns a logged-in ftplib
+        # session or None; park_connection(session) keeps one for later
+        self.take_connection = take_connection
+        self.park_connection = park_connection
+        self.log_callback = log_callback  # Optional thread-safe GUI log, e.g. queue_log
         self.running = True
         self.ftp_host = None
         self.downloaded_paths = set()  # Track downloaded paths to avoid duplicates
+        # Written only by this thread and summed by the GUI, so neither the
+        # per-chunk byte count nor the per-file counts take the stats lock
+        self.bytes_downloaded = 0
+        self.files_succeeded = 0
+        self.files_failed = 0
+        stats['worker_counters'].append(self)
+        self._connection_lost = False  # Set when the last download failed at the connection level
+        self._segment_refused = False  # Set once the server refused a segmented download's extra login
+        self._buffer = bytearray(TRANSFER_BUFFER_SIZE)  # Reused for every file
+        self._view = memoryview(self._buffer)
+        # (read fd, write fd) of the pipe used by _splice_chunk, opened on first use;
+        # False once splice turned out not to work for this worker's target
+        self._splice_pipe = None if SPLICE_AVAILABLE else False
+        self._splice_len = 64 * 1024  # Bytes one splice may move - the pipe's capacity (Linux default)
+        self._data_conns = set()  # Data connections being read right now, for abort()
+        
+    def _connect(self):
+        """Open an ftputil connection to the server for this worker"""
+        # Create session factory that doesn't send UTF8 command
+        if self.use_tls:
+            session_factory = create_no_utf8_session_factory(
+                base_class=TunedFTP_TLS,
+                port=self.port,
+                use_passive_mode=True,
+                encrypt_data_channel=True
+            )
+        else:
+            session_factory = create_no_utf8_session_factory(
+                base_class=TunedFTP,
+                port=self.port,
+                use_passive_mode=True,
+                encrypt_data_channel=False
+            )
+        if self.take_connection:
+            connect = session_factory
+            
+            def session_factory(*args):
+                # Skip the banner/login round trips when a pooled session is free
+                return self.take_connection() or connect(*args)
+        self._session_factory = session_factory  # Also opens segmented downloads' extra streams
+        
+        # Create FTPHost with custom session factory (no UTF8 command will be sent)
+        ftp_host = ftputil.FTPHost(self.host, self.username, self.password,
+                                   session_factory=session_factory)
         
+        # Synchronize times for accurate timestamp preservation
+        try:
+            ftp_host.synchronize_times()
+        except Exception:
+            pass  # Continue even if time sync fails
+        return ftp_host
+    
+    def _reconnect(self):
+        """Replace a dead connection with a fresh one, backing off between tries
+        
+        Returns False, with ftp_host left None, if the worker was stopped or
+        every attempt failed (server down, 421 too many connections).
+        """
+        ftp_host, self.ftp_host = self.ftp_host, None
+        if ftp_host:
+            try:
+                ftp_host.close()
+            except Exception:
+                pass
+        delay = RECONNECT_BACKOFF
+        for _ in range(RECONNECT_ATTEMPTS):
+            # Wait in short steps so Stop isn't held up by the backoff
+            deadline = time.monotonic() + delay
+            while self.running and time.monotonic() < deadline:
+                time.sleep(0.1)
+            if not self.running:
+                return False
+            try:
+                self.ftp_host = self._connect()
+                return True
+            except Exception as e:
+                last_error = e
+            delay *= 2
+        with self.stats['lock']:
+            self.stats['errors'].append(f"Worker {self.worker_id} could not reconnect: {last_error}")
+        return False
+    
     def run(self):
         """Main worker loop - pulls files from queue and downloads them"""
         # Connect to FTP server once per worker using ftputil
         try:
-            # Create session factory that doesn't send UTF8 command
-            if self.use_tls:
-                session_factory = create_no_utf8_session_factory(
-                    base_class=ftplib.FTP_TLS,
-                    port=self.port,
-                    use_passive_mode=True,
-                    encrypt_data_channel=True
-                )
-            else:
-                session_factory = create_no_utf8_session_factory(
-                    base_class=ftplib.FTP,
-                    port=self.port,
-                    use_passive_mode=True,
-                    encrypt_data_channel=False
-                )
-            
-            # Create FTPHost with custom session factory (no UTF8 command will be sent)
-            self.ftp_host = ftputil.FTPHost(self.host, self.username, self.password,
-                                           session_factory=session_factory)
-            
-            # Synchronize times for accurate timestamp preservation
-            try:
-                self.ftp_host.synchronize_times()
-            except Exception:
-                pass  # Continue even if time sync fails
-                
+            self.ftp_host = self._connect()
         except Exception as e:
             error_msg = f"Worker {self.worker_id} connection failed: {str(e)}"
             with self.stats['lock']:
@@ -103,48 +982,35 @@ class DownloadWorker(threading.Thread):
         while self.running:
             try:
                 # Get task from queue (with timeout to check running flag)
-                task = self.download_queue.get(timeout=1)
+                task = self.download_queue.get(timeout=1, worker_id=self.worker_id)
                 if task is None:  # Poison pill to stop
                     break
                 
-                remote_path, local_path = task
+                # Scanners pass the listed size as a third element; re-queued
+                # retries only carry the two paths
+                remote_path, local_path = task[0], task[1]
+                file_size = task[2] if len(task) > 2 else None
+                downloaded_paths = self.stats['downloaded_paths']
+                downloading_paths = self.stats['downloading_paths']
                 
-                # Check if file already exists locally
-                if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                # Check if file already exists locally (and isn't the partial
+                # file of a duplicate task another worker is still writing)
+                if _local_size(local_path) > 0 and remote_path not in downloading_paths:
                     # File already exists, skip download
-                    with self.stats['lock']:
-                        if 'downloaded_paths' not in self.stats:
-                            self.stats['downloaded_paths'] = set()
-                        if remote_path not in self.stats['downloaded_paths']:
-                            self.stats['downloaded_paths'].add(remote_path)
-                            # Don't increment total here - it was already counted when discovered
-                            self.stats['completed'] += 1
-                            self.stats['success'] += 1
+                    if downloaded_paths.add_if_absent(remote_path):
+                        # Don't increment total here - it was already counted when discovered
+                        self.files_succeeded += 1
+                        self.stats['dirty_event'].set()
                     if self.status_callback:
                         self.status_callback(remote_path, "Completed")
                     self.download_queue.task_done()
                     continue
                 
                 # Check if already downloaded or currently being downloaded (race condition protection)
-                with self.stats['lock']:
-                    if 'downloaded_paths' not in self.stats:
-                        self.stats['downloaded_paths'] = set()
-                    if 'downloading_paths' not in self.stats:
-                        self.stats['downloading_paths'] = set()
-                    if 'queued_files' not in self.stats:
-                        self.stats['queued_files'] = 0
-                    
-                    # Skip if already downloaded or currently downloading
-                    if remote_path in self.stats['downloaded_paths']:
-                        self.download_queue.task_done()
-                        continue
-                    if remote_path in self.stats['downloading_paths']:
-                        self.download_queue.task_done()
-                        continue
-                    
-                    # Mark as downloading (file is now being processed)
-                    # Note: We don't decrement queued_files here because queue.qsize() is more accurate
-                    self.stats['downloading_paths'].add(remote_path)
+                # Claiming the path in downloading_paths is atomic, so only one worker wins
+                if remote_path in downloaded_paths or not downloading_paths.add_if_absent(remote_path):
+                    self.download_queue.task_done()
+                    continue
                 
                 try:
                     # Notify that download is starting
@@ -152,19 +1018,29 @@ class DownloadWorker(threading.Thread):
                         self.status_callback(remote_path, "Downloading...")
                     
                     # Create local directory if needed
-                    local_dir = os.path.dirname(local_path)
-                    if local_dir:
-                        os.makedirs(local_dir, exist_ok=True)
+                    self._ensure_dir(os.path.dirname(local_path))
                     
                     # Download file using FTP
-                    self._download_file(remote_path, local_path)
+                    try:
+                        self._download_file(remote_path, local_path, file_size)
+                    except Exception:
+                        if not self._connection_lost or not self.running:
+                            raise
+                        # The connection died (timeout, 421, reset) - don't let it fail
+                        # every remaining task; reconnect and try this file once more
+                        if not self._reconnect():
+                            # Still no connection - leave the file to the other
+                            # workers and stop rather than fail every task
+                            downloading_paths.discard(remote_path)
+                            self.download_queue.put(task)
+                            break
+                        self._download_file(remote_path, local_path, file_size)
                     
                     # Update stats - mark as downloaded and remove from downloading
-                    with self.stats['lock']:
-                        self.stats['downloading_paths'].discard(remote_path)
-                        self.stats['downloaded_paths'].add(remote_path)
-                        self.stats['completed'] += 1
-                        self.stats['success'] += 1
+                    downloaded_paths.add(remote_path)
+                    downloading_paths.discard(remote_path)
+                    self.files_succeeded += 1
+                    self.stats['dirty_event'].set()
                     
                     # Notify that download completed
                     if self.status_callback:
@@ -177,20 +1053,20 @@ class DownloadWorker(threading.Thread):
                     # Some FTP servers return this as part of normal operation
                     if '200' in error_msg and ('TYPE' in error_msg.upper() or 'binary' in error_msg.lower()):
                         # This is actually a success message, treat as completed
-                        with self.stats['lock']:
-                            self.stats['downloading_paths'].discard(remote_path)
-                            self.stats['downloaded_paths'].add(remote_path)
-                            self.stats['completed'] += 1
-                            self.stats['success'] += 1
+                        # Add before discarding so the path is never in neither set
+                        downloaded_paths.add(remote_path)
+                        downloading_paths.discard(remote_path)
+                        self.files_succeeded += 1
+                        self.stats['dirty_event'].set()
                         if self.status_callback:
                             self.status_callback(remote_path, "Completed")
                     else:
                         # Real error - remove from downloading but don't mark as downloaded
+                        downloading_paths.discard(remote_path)
+                        self.files_failed += 1
                         with self.stats['lock']:
-                            self.stats['downloading_paths'].discard(remote_path)
-                            self.stats['completed'] += 1
-                            self.stats['failed'] += 1
                             self.stats['errors'].append(f"{remote_path}: {error_msg}")
+                        self.stats['dirty_event'].set()
                         
                         # Notify that download failed
                         if self.status_callback:
@@ -204,137 +1080,32 @@ class DownloadWorker(threading.Thread):
                 # Queue is empty, check if we should continue
                 continue
             except Exception as e:
-                with self.stats['lock']:
-                    self.stats['errors'].append(f"Worker {self.worker_id} error: {str(e)}")
-        
-        # Disconnect when done
-        if self.ftp_host:
-            try:
-                self.ftp_host.close()
-            except:
-                pass
-            self.ftp_host = None
-    
-    def _download_recursive(self, current_path, base_path):
-        """Recursively download all files from a directory"""
-        if not self.running:
-            return
-        
-        try:
-            # Change to current directory
-            if current_path != '/':
-                self.ftp.cwd(current_path)
-            else:
-                self.ftp.cwd('/')
-            
-            # List directory contents
-            items = []
-            try:
-                # Try MLSD first (more reliable)
-                for item in self.ftp.mlsd():
-                    items.append(item)
-            except:
-                # Fallback to LIST
-                lines = []
-                self.ftp.retrlines('LIST', lines.append)
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 9:
-                        name = ' '.join(parts[8:])
-                        is_dir = parts[0].startswith('d')
-                        size = parts[4] if len(parts) > 4 else 'Unknown'
-                        items.append((name, {'type': 'dir' if is_dir else 'file', 'size': size}))
-            
-            # Separate directories and files to ensure we process ALL files
-            # Process files first, then directories
-            dirs = []
-            files = []
-            
-            for name, info in items:
-                if name in ['.', '..']:
-                    continue
-                
-                # Build proper path preserving structure
-                if current_path == '/':
-                    remote_path = f"/{name}"
-                else:
-                    remote_path = f"{current_path.rstrip('/')}/{name}"
-                remote_path = remote_path.replace('\\', '/')
-                
-                if info.get('type') == 'dir':
-                    dirs.append((remote_path, info))
-                else:
-                    files.append((remote_path, info))
-            
-            # Process files first - this ensures root-level files are downloaded
-            for remote_path, info in files:
-                if not self.running:
-                    break
-                
-                # Calculate local path - preserve exact 1:1 structure
-                if remote_path.startswith('/'):
-                    rel_path = remote_path[1:]
-                else:
-                    rel_path = remote_path
-                
-                local_path = os.path.join(self.local_dir, rel_path)
-                
-                # Skip if already downloaded (avoid duplicates across workers)
-                with self.stats['lock']:
-                    if remote_path in self.stats.get('downloaded_paths', set()):
-                        continue
-                    if 'downloaded_paths' not in self.stats:
-                        self.stats['downloaded_paths'] = set()
-                    self.stats['downloaded_paths'].add(remote_path)
-                    # Don't increment total here - it was already counted when discovered
-                
-                try:
-                    # Notify that download is starting
-                    if self.status_callback:
-                        self.status_callback(remote_path, "Downloading...")
-                    
-                    # Create local directory if needed
-                    local_dir = os.path.dirname(local_path)
-                    if local_dir:
-                        os.makedirs(local_dir, exist_ok=True)
-                    
-                    # Download file using FTP
-                    self._download_file(remote_path, local_path)
-                    
-                    # Update stats
-                    with self.stats['lock']:
-                        self.stats['completed'] += 1
-                        self.stats['success'] += 1
-                    
-                    # Notify that download completed
-                    if self.status_callback:
-                        self.status_callback(remote_path, "Completed")
-                    
-                except Exception as e:
-                    # Update stats
-                    with self.stats['lock']:
-                        self.stats['completed'] += 1
-                        self.stats['failed'] += 1
-                        self.stats['errors'].append(f"{remote_path}: {str(e)}")
-                    
-                    # Notify that download failed
-                    if self.status_callback:
-                        # Show full error message (or at least more of it)
-                        self.status_callback(remote_path, f"Failed: {str(e)[:100]}")
-            
-            # Then recursively process directories
-            for remote_path, info in dirs:
-                if not self.running:
-                    break
-                # Recursively download subdirectory
-                self._download_recursive(remote_path, base_path)
-                            
-        except Exception as e:
-            with self.stats['lock']:
-                self.stats['errors'].append(f"Error in {current_path}: {str(e)}")
+                with self.stats['lock']:
+                    self.stats['errors'].append(f"Worker {self.worker_id} error: {str(e)}")
+        
+        self._close_splice_pipe()
+        
+        # Disconnect when done - or, after a normal finish on a healthy
+        # connection, hand the session back for the next scan or download
+        ftp_host, self.ftp_host = self.ftp_host, None
+        if ftp_host:
+            if self.park_connection and self.running and not self._connection_lost:
+                # Only the main session is pooled
+                session = detach_ftp_session(ftp_host)
+                if session is not None:
+                    self.park_connection(session)
+            else:
+                try:
+                    ftp_host.close()
+                except:
+                    pass
     
-    def _download_file(self, remote_path, local_path):
-        """Download a single file using ftputil (preserves timestamps)"""
+    def _download_file(self, remote_path, local_path, file_size=None):
+        """Download a single file (preserves timestamps)
+        
+        file_size comes from the directory listing; it's only probed with an
+        extra round trip when the caller doesn't know it.
+        """
         # ftputil works with paths relative to current directory or absolute paths
         # Normalize the path - try both absolute (with /) and relative (without /)
         remote_path_normalized = remote_path
@@ -343,63 +1114,103 @@ class DownloadWorker(threading.Thread):
         
         remote_path_alt = remote_path.lstrip('/')
         
-        # Get file size for progress tracking
-        file_size = None
+        # Get file size for progress tracking if the listing didn't provide it
         working_path = None
-        for try_path in [remote_path_normalized, remote_path_alt]:
-            try:
-                file_size = self.ftp_host.path.getsize(try_path)
-                working_path = try_path
-                break
-            except Exception:
-                continue
+        if file_size is None:
+            for try_path in [remote_path_normalized, remote_path_alt]:
+                try:
+                    file_size = self.ftp_host.path.getsize(try_path)
+                    working_path = try_path
+                    break
+                except Exception:
+                    continue
 
         downloaded = 0
         start_time = time.time()
         last_update_time = start_time
         last_bytes = 0
-        chunk_size = 8192  # 8KB chunks for progress updates
+        buffer = self._buffer
+        view = self._view
 
-        # Download file using ftputil's open() method for progress tracking
-        # Try both path formats if needed
+        # Download with a raw RETR for progress tracking. RETR the absolute
+        # path first (no CWD round trip), and only on a 550 fall back to
+        # CWD + basename for servers that reject paths in RETR
+        remote_dir, _, basename = remote_path_normalized.rpartition('/')
+        attempts = [(None, remote_path_normalized), (remote_dir or '/', basename)]
         download_succeeded = False
         last_error = None
+        self._connection_lost = False
+        part_path = local_path + PARTIAL_SUFFIX
         
-        for try_path in [working_path, remote_path_normalized, remote_path_alt]:
-            if try_path is None:
-                continue
+        if self._can_segment(file_size):
+            try:
+                download_succeeded = self._download_segmented(remote_path_normalized, local_path, file_size)
+            except Exception as e:
+                if self._connection_lost or not self.running:
+                    raise  # run() reconnects and retries, or the download was stopped
+                # The single stream below starts the file over
+                if self.log_callback:
+                    self.log_callback(f"Worker {self.worker_id}: segmented download of {remote_path_normalized} "
+                                      f"abandoned ({e}), using a single stream")
+            if download_succeeded:
+                attempts = []
+                self._preserve_mtime(local_path, working_path or remote_path_normalized)
+        
+        for directory, try_path in attempts:
+            session = self.ftp_host._session
             try:
-                with self.ftp_host.open(try_path, 'rb') as remote_file:
-                    with open(local_path, 'wb') as local_file:
+                if directory is not None:
+                    session.cwd(directory)
+                # RETR on the raw control session, receiving straight into the
+                # worker's reusable buffer - no per-chunk bytes objects
+                session.voidcmd('TYPE I')
+                conn = session.transfercmd(f'RETR {try_path}')
+                self._data_conns.add(conn)
+                transfer_done = False
+                try:
+                    fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                    # Reserve the whole file up front so the filesystem can lay it out contiguously
+                    preallocated = False
+                    if file_size and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(fd, 0, file_size)
+                            preallocated = True
+                        except OSError:
+                            pass  # Not supported by this filesystem
+                    # TLS data channels have to be decrypted in Python, so only
+                    # plain sockets can be spliced
+                    splice = self._splice_pipe is not False and type(conn) is socket.socket
+                    # Bound once - the loop below runs per chunk, so its lookups add up at line rate
+                    recv_into, write, clock, splice_chunk = conn.recv_into, os.write, time.time, self._splice_chunk
+                    try:
                         while True:
-                            chunk = remote_file.read(chunk_size)
-                            if not chunk:
+                            if splice and self._splice_pipe is not False:
+                                data_len = splice_chunk(conn, fd)
+                            else:
+                                data_len = recv_into(buffer)
+                                written = 0
+                                while written < data_len:
+                                    written += write(fd, view[written:data_len])
+                            if not data_len:
                                 break
                             
-                            data_len = len(chunk)
-                            local_file.write(chunk)
                             downloaded += data_len
-                            current_time = time.time()
+                            current_time = clock()
 
                             # Update total bytes downloaded for speed calculation
-                            with self.stats['lock']:
-                                self.stats['bytes_downloaded'] += data_len
+                            self.bytes_downloaded += data_len
 
-                            # Calculate speed for this file (update every 0.5 seconds)
+                            # Calculate speed and report progress for this file (every 0.5 seconds;
+                            # the chunks in between only touch locals)
                             if current_time - last_update_time >= 0.5:
+                                self.stats['dirty_event'].set()
                                 elapsed = current_time - last_update_time
                                 bytes_since_last = downloaded - last_bytes
                                 file_speed = bytes_since_last / elapsed if elapsed > 0 else 0
                                 last_update_time = current_time
                                 last_bytes = downloaded
 
-                                # Format speed
-                                if file_speed >= 1024 * 1024:
-                                    speed_str = f"{file_speed / (1024 * 1024):.1f} MB/s"
-                                elif file_speed >= 1024:
-                                    speed_str = f"{file_speed / 1024:.1f} KB/s"
-                                else:
-                                    speed_str = f"{file_speed:.0f} B/s"
+                                speed_str = format_speed(file_speed)
 
                                 if file_size and self.status_callback:
                                     percent = int((downloaded / file_size) * 100) if file_size else 0
@@ -407,34 +1218,60 @@ class DownloadWorker(threading.Thread):
                                 if self.progress_callback and file_size:
                                     percent = int((downloaded / file_size) * 100) if file_size else 0
                                     self.progress_callback(self.worker_id, remote_path, percent)
-                            else:
-                                # Still update status but not speed
-                                if file_size and self.status_callback:
-                                    percent = int((downloaded / file_size) * 100) if file_size else 0
-                                    self.status_callback(remote_path, f"Downloading {percent}%")
-                                if self.progress_callback and file_size:
-                                    percent = int((downloaded / file_size) * 100) if file_size else 0
-                                    self.progress_callback(self.worker_id, remote_path, percent)
-                
-                # Preserve the modification time from the remote file
-                try:
-                    # Use the working path that succeeded
-                    mtime_path = working_path if working_path else try_path
-                    remote_mtime = self.ftp_host.path.getmtime(mtime_path)
-                    # Set the modification time on the local file
-                    os.utime(local_path, (remote_mtime, remote_mtime))
-                except Exception:
-                    # If we can't get/set the mtime, continue anyway (file is downloaded)
-                    pass
+                    finally:
+                        if preallocated:
+                            # Drop the reserved tail if the transfer ended short, so a
+                            # partial file never looks complete
+                            try:
+                                os.ftruncate(fd, os.lseek(fd, 0, os.SEEK_CUR))
+                            except OSError:
+                                pass
+                        if downloaded >= CACHE_DROP_MIN_SIZE and hasattr(os, 'posix_fadvise'):
+                            # DONTNEED only drops clean pages, so write them back first
+                            try:
+                                os.fdatasync(fd)
+                                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                            except OSError:
+                                pass
+                        os.close(fd)
+                        self.stats['dirty_event'].set()
+                    transfer_done = True
+                finally:
+                    self._data_conns.discard(conn)
+                    conn.close()
+                    if not transfer_done:
+                        # Consume the 426/226 reply so the control connection stays in sync
+                        try:
+                            session.getresp()
+                        except ftplib.all_errors:
+                            pass
+                session.voidresp()
                 
+                os.replace(part_path, local_path)
+                self._preserve_mtime(local_path, working_path or remote_path_normalized)
                 download_succeeded = True
                 break  # Success, exit the loop
                 
             except Exception as e:
                 last_error = e
-                continue  # Try next path format
+                if is_connection_error(e):
+                    self._connection_lost = True
+                    break
+                if not str(e).startswith('550'):
+                    break  # Only "not found" is worth retrying with another path form
+            finally:
+                if directory is not None:
+                    # Put the session back where ftputil thinks it is
+                    try:
+                        session.cwd(self.ftp_host.getcwd())
+                    except ftplib.all_errors:
+                        pass
         
         if not download_succeeded:
+            try:
+                os.unlink(part_path)
+            except OSError:
+                pass
             error_msg = str(last_error) if last_error else "Unknown error"
             # Check for common FTP error codes and provide better messages
             if '550' in error_msg or 'not found' in error_msg.lower() or 'No such file' in error_msg:
@@ -445,6 +1282,218 @@ class DownloadWorker(threading.Thread):
             else:
                 raise Exception(f"FTP error: {error_msg}")
     
+    def _preserve_mtime(self, local_path, remote_path):
+        """Give the local file the remote file's modification time"""
+        try:
+            remote_mtime = self.ftp_host.path.getmtime(remote_path)
+            os.utime(local_path, (remote_mtime, remote_mtime))
+        except Exception:
+            # If we can't get/set the mtime, continue anyway (file is downloaded)
+            pass
+    
+    def _can_segment(self, file_size):
+        """Whether a file of file_size should be fetched by _download_segmented"""
+        if not file_size or file_size < SEGMENTED_MIN_SIZE or SEGMENT_STREAMS < 2:
+            return False
+        if self._segment_refused:
+            return False  # Don't try the server's connection limit on every large file
+        if not hasattr(os, 'pwrite'):
+            return False  # Windows - segments can't write at their own offsets
+        # REST is what lets each stream start mid-file
+        return 'REST' in get_server_features(self.ftp_host._session)
+    
+    def _download_segmented(self, remote_path, local_path, file_size):
+        """Fetch a large file over several data connections, one byte range each
+        
+        The worker's own session carries the first range; the others come from
+        the pool or new logins. Returns False when no extra connection could be
+        opened. Raises if any range fails - the caller then downloads the file
+        over a single stream instead, or reconnects first if the failed range
+        was the worker's own session's.
+        """
+        slots = self._extra_stream_slots
+        sessions = [self.ftp_host._session]
+        for _ in range(SEGMENT_STREAMS - 1):
+            if not slots.acquire(blocking=False):
+                break  # Other workers hold all the extra streams
+            try:
+                sessions.append(self._session_factory(self.host, self.username, self.password))
+            except Exception:
+                slots.release()
+                # Most likely the server's per-client connection limit, which
+                # won't be different for the next large file
+                self._segment_refused = True
+                break  # Go with the connections already open
+        extra = sessions[1:]
+        if not extra:
+            return False
+        
+        step = -(-file_size // len(sessions))  # Ceiling division
+        ranges = [(start, min(start + step, file_size)) for start in range(0, file_size, step)]
+        errors = [None] * len(sessions)
+        # Bytes received per range, each written only by its range's thread;
+        # this thread sums them into bytes_downloaded, so no lock per chunk
+        received = [0] * len(ranges)
+        counted = 0
+        
+        try:
+            # Written under the .part name like single-stream downloads, so the
+            # preallocated file never carries the final name until it's complete
+            part_path = local_path + PARTIAL_SUFFIX
+            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            completed = False
+            try:
+                # Reserve the whole file, so the interleaved ranges don't fragment it
+                try:
+                    os.posix_fallocate(fd, 0, file_size)
+                except (AttributeError, OSError):
+                    os.ftruncate(fd, file_size)
+                
+                def fetch(index):
+                    start, end = ranges[index]
+                    try:
+                        self._fetch_range(sessions[index], remote_path, fd, start, end, received, index)
+                    except Exception as e:
+                        errors[index] = e
+                
+                threads = [threading.Thread(target=fetch, args=(i,), daemon=True) for i in range(len(ranges))]
+                for thread in threads:
+                    thread.start()
+                
+                # Report progress for the whole file while the ranges arrive
+                last_update_time = time.time()
+                for thread in threads:
+                    while thread.is_alive():
+                        thread.join(0.5)
+                        current_time = time.time()
+                        if current_time - last_update_time >= 0.5:
+                            done = sum(received)
+                            speed_str = format_speed((done - counted) / (current_time - last_update_time))
+                            self.bytes_downloaded += done - counted
+                            counted = done
+                            last_update_time = current_time
+                            self.stats['dirty_event'].set()
+                            if self.status_callback:
+                                self.status_callback(remote_path, f"Downloading {int(done * 100 / file_size)}%", speed_str)
+                
+                if errors[0] is not None:
+                    # The worker's own control connection may be out of sync
+                    # now, so it mustn't carry the single-stream retry
+                    self._connection_lost = True
+                for error in errors:
+                    if error is not None:
+                        raise error
+                completed = True
+            finally:
+                os.close(fd)
+                if completed:
+                    self.bytes_downloaded += sum(received) - counted
+                    os.replace(part_path, local_path)
+                else:
+                    # The caller fetches the whole file again over one stream, so
+                    # take back the bytes counted so far, and drop the file of holes
+                    self.bytes_downloaded -= counted
+                    try:
+                        os.unlink(part_path)
+                    except OSError:
+                        pass
+                self.stats['dirty_event'].set()
+        finally:
+            # Extra connections that finished their range cleanly go back to the pool
+            for session, error in zip(extra, errors[1:]):
+                if error is None and self.park_connection and self.running:
+                    self.park_connection(session)
+                else:
+                    try:
+                        session.close()
+                    except Exception:
+                        pass
+                slots.release()
+        return True
+    
+    def _fetch_range(self, session, remote_path, fd, start, end, received, index):
+        """RETR bytes [start, end) of remote_path on session, pwrite-ing them into fd
+        
+        Bytes received so far are kept in received[index].
+        """
+        buffer = bytearray(TRANSFER_BUFFER_SIZE)
+        view = memoryview(buffer)
+        position = start
+        session.voidcmd('TYPE I')
+        conn = session.transfercmd(f'RETR {remote_path}', rest=start)
+        self._data_conns.add(conn)
+        # Bound once - the loop below runs per chunk
+        recv_into, pwrite, chunk_size = conn.recv_into, os.pwrite, len(buffer)
+        try:
+            while position < end and self.running:
+                data_len = recv_into(buffer, min(chunk_size, end - position))
+                if not data_len:
+                    break
+                written = 0
+                while written < data_len:
+                    written += pwrite(fd, view[written:data_len], position + written)
+                position += data_len
+                received[index] = position - start
+        finally:
+            self._data_conns.discard(conn)
+            conn.close()
+        # Closing the data connection before the end of the file aborts the
+        # transfer, so anything but the last range normally gets a 426 here
+        try:
+            session.voidresp()
+        except ftplib.error_temp:
+            pass
+        if position < end:
+            raise EOFError(f"Range {start}-{end} of {remote_path} stopped at {position}")
+    
+    def _splice_chunk(self, conn, fd):
+        """Move up to one pipe's worth of data from conn to fd with os.splice, returning its length"""
+        if self._splice_pipe is None:
+            self._splice_pipe = os.pipe()
+            try:
+                import fcntl
+                # Returns the capacity actually set (rounded up to whole pages)
+                self._splice_len = fcntl.fcntl(self._splice_pipe[1], fcntl.F_SETPIPE_SZ, SPLICE_PIPE_SIZE)
+            except (ImportError, AttributeError, OSError):
+                pass  # Keep the default 64 KB pipe
+        pipe_r, pipe_w = self._splice_pipe
+        while True:
+            try:
+                # The pipe is empty here, so this never blocks on the write side
+                data_len = os.splice(conn.fileno(), pipe_w, self._splice_len)
+                break
+            except BlockingIOError:
+                # A socket with a timeout is non-blocking underneath
+                if not select.select([conn], [], [], conn.gettimeout())[0]:
+                    raise TimeoutError("timed out")
+        moved = 0
+        try:
+            while moved < data_len:
+                moved += os.splice(pipe_r, fd, data_len - moved)
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+            # The target filesystem doesn't take splice - copy out what's in
+            # the pipe and use recv_into from now on
+            while moved < data_len:
+                moved += os.write(fd, os.read(pipe_r, data_len - moved))
+            self._close_splice_pipe()
+            self._splice_pipe = False
+        return data_len
+    
+    def _close_splice_pipe(self):
+        """Close the splice pipe, if one was opened"""
+        if self._splice_pipe:
+            for pipe_fd in self._splice_pipe:
+                os.close(pipe_fd)
+            self._splice_pipe = None
+    
+    def _ensure_dir(self, local_dir):
+        """os.makedirs, skipped for directories this worker already created"""
+        if local_dir and local_dir not in self._created_dirs:
+            os.makedirs(local_dir, exist_ok=True)
+            self._created_dirs.add(local_dir)
+    
     def stop(self):
         """Stop the worker"""
         self.running = False
@@ -453,6 +1502,34 @@ class DownloadWorker(threading.Thread):
                 self.ftp_host.close()
             except:
                 pass
+    
+    def abort_transfers(self):
+        """Shut down the data connections being read, so the current file ends now
+        
+        Only shut down, not closed - the reading thread still owns the socket and
+        closes it itself once recv returns.
+        """
+        for conn in list(self._data_conns):
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    
+    def abort(self):
+        """Shut down this worker's sockets so a read blocked in recv errors out"""
+        self.abort_transfers()
+        ftp_host = self.ftp_host
+        if not ftp_host:
+            return
+        for session in ftp_host_sessions(ftp_host):
+            sock = getattr(session, 'sock', None)
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+                sock.close()
+            except OSError:
+                pass
 
 
 class FTPDownloaderGUI:
@@ -483,39 +1560,60 @@ class FTPDownloaderGUI:
                 pass  # Icon setting failed, continue without it
         
         # State variables
-        self.download_queue = queue.Queue()
+        self.download_queue = TaskQueue()
         self.workers = []
         self.stats = {
             'total': 0,
-            'completed': 0,
-            'success': 0,
-            'failed': 0,
             'errors': [],
             'lock': threading.Lock(),
-            'bytes_downloaded': 0,  # Total bytes downloaded
+            'worker_counters': [],  # Workers whose byte and file counters sum to the session totals
             'total_size': 0,  # Total size of all files to download (in bytes)
+            'queued_files': 0,  # Count of files that have been queued
             'download_start_time': None,  # When download started
-            'last_bytes': 0,  # Bytes at last speed calculation
-            'last_speed_time': None,  # Time of last speed calculation
-            'current_speed': 0.0  # Current download speed in bytes/sec
+            'speed_samples': None,  # Deque of (monotonic time, bytes) over the last SPEED_WINDOW
+            'dirty_event': threading.Event(),  # Set by workers/scanners when stats change
+            'downloaded_paths': ShardedPathSet(),  # Paths finished across all workers
+            'downloading_paths': ShardedPathSet(),  # Paths claimed by a worker
         }
+        self.last_progress_update = 0.0  # time.monotonic() of update_progress's last redraw
+        self._last_stats_str = None  # Text last set on stats_var, see _set_stats_text
         self.is_downloading = False
         self.file_list = []
+        self.file_list_set = set()  # Remote paths in file_list, for O(1) duplicate checks
         self.download_process = None
         self.file_to_item = {}  # Map file paths to tree item IDs
+        self.file_sizes = {}  # Size shown for queued files, whose rows appear when their download starts
         self.current_downloads = {}  # Track currently downloading files
         self.downloading_items_moved = set()  # Track which items have been moved to top
-        self.completed_downloads = []  # Track completed downloads
-        self.failed_downloads = []  # Track failed downloads as (remote_path, local_path) tuples
+        self.completed_downloads = set()  # Track completed downloads
+        self.failed_downloads = set()  # Remote paths of failed downloads (local paths are in failed_downloads_dict)
         self.failed_downloads_dict = {}  # Track failed downloads: {remote_path: local_path}
         self.scanner_done = False  # Track if scanners have finished discovering files
-        self.scanned_dirs = set()  # Track which directories have been scanned (for parallel scanners)
-        self.scanned_dirs_lock = threading.Lock()  # Lock for scanned_dirs set
+        self._last_discover_log = 0.0  # Monotonic time of the last "Discovered N files" line
+        # Directories already claimed by a scanner - sharded, and checked without a
+        # lock first, so parallel scanners rarely wait on each other here
+        self.scanned_dirs = ShardedPathSet()
+        self.file_list_lock = threading.Lock()  # Guards file_list appends from the Scan button's scanners
         self.scanner_count = 0  # Track number of active scanners
         self.scanner_count_lock = threading.Lock()  # Lock for scanner_count
+        self.dir_queue = None  # Directory queue shared by the active scanners
+        self._local_index = {}  # Relative path -> size of files already in the local directory
+        self._local_index_ready = threading.Event()  # Set once _local_index is built
+        self._idle_ftp = []  # (settings, connection) pairs left logged in by Test Connection and Scan
+        self._idle_ftp_lock = threading.Lock()
+        # Remote path -> (monotonic time, dirs, files) from the download scanners,
+        # for the server/login in _listing_cache_key
+        self._listing_cache = {}
+        self._listing_cache_key = None
         self.completion_dialog_shown = False  # Prevent showing dialog multiple times
-        self.completion_checks_passed = 0  # Track consecutive successful completion checks
+        self.done_event = threading.Event()  # Set once every download worker has exited
         self.all_tree_items = set()  # Track all treeview items for search filtering
+        self.status_queue = collections.deque()  # (remote_path, status, speed) from workers
+        self._completed_rows = []  # Completed paths waiting to be appended to completed_listbox
+        self.log_queue = collections.deque()  # Messages logged from worker and scanner threads
+        self._pending_tree = collections.deque()  # Discovered rows waiting for the treeview
+        self._tree_overflow = collections.deque()  # Rows held back by TREEVIEW_MAX_ROWS
+        self._tree_drain_scheduled = False
         
         # Load status images
         self.status_images = {}
@@ -548,6 +1646,8 @@ class FTPDownloaderGUI:
                 self.has_pil = False
         
         self.setup_ui()
+        self.root.after(PROGRESS_POLL_MS, self._drain_status_queue)
+        self.root.after(PROGRESS_POLL_MS, self._drain_log_queue)
         
     def setup_ui(self):
         """Create the user interface"""
@@ -615,8 +1715,8 @@ class FTPDownloaderGUI:
         
         # Number of scanners
         ttk.Label(settings_frame, text="Number of Scanners:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
-        self.scanners_var = tk.IntVar(value=4)
-        scanners_spin = ttk.Spinbox(settings_frame, from_=1, to=10, 
+        self.scanners_var = tk.IntVar(value=8)
+        scanners_spin = ttk.Spinbox(settings_frame, from_=1, to=32, 
                                     textvariable=self.scanners_var, width=10)
         scanners_spin.grid(row=0, column=3, padx=5, pady=5)
         
@@ -647,8 +1747,14 @@ class FTPDownloaderGUI:
         stats_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
         
         # Stats
-        self.stats_var = tk.StringVar(value="Files: 0 | Total Size: Unknown | Progress: N/A | ETA: N/A | Completed: 0 | Pending: 0 | Failed: 0 | Speed: 0 B/s")
+        self._last_stats_str = STATS_TEMPLATE.format(total=0, total_size="Unknown", progress="N/A", eta="N/A",
+                                                     completed=0, pending=0, failed=0, speed="0 B/s")
+        self.stats_var = tk.StringVar(value=self._last_stats_str)
         ttk.Label(stats_frame, textvariable=self.stats_var).pack(anchor=tk.W)
+        # Outcome of the last download - a banner rather than a modal dialog,
+        # which would stall the Tk loop and its after() timers until dismissed
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(stats_frame, textvariable=self.status_var, font=('', 9, 'bold')).pack(anchor=tk.W)
         
         # Remove progress_var and progress_bar references - they're no longer needed
         
@@ -768,6 +1874,7 @@ class FTPDownloaderGUI:
         clear_log_button.pack(side=tk.RIGHT, padx=5)
         
         self.log_text = scrolledtext.ScrolledText(log_frame, height=6, wrap=tk.WORD)
+        self._last_log_prefix = None  # Progress prefix of the last log line, for coalescing
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
         # Configure grid weights
@@ -788,14 +1895,60 @@ class FTPDownloaderGUI:
         self._setup_system_tray()
         
     def log(self, message):
-        """Add message to log"""
-        self.log_text.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {message}\n")
+        """Add message to log, replacing the previous line if both are progress counters"""
+        self._write_log((message,))
+    
+    def _write_log(self, messages):
+        """Append messages with a single Text insert, coalescing progress counter lines"""
+        stamp = time.strftime('%H:%M:%S')
+        lines = []
+        last_prefix = self._last_log_prefix
+        replace_last_line = False
+        for message in messages:
+            prefix = message.startswith(LOG_COALESCE_PREFIXES) and message.split(' ', 1)[0]
+            if prefix and prefix == last_prefix:
+                # Drop the previous "Discovered N files..." line instead of piling them up
+                if lines:
+                    lines.pop()
+                else:
+                    replace_last_line = True
+            last_prefix = prefix
+            lines.append(f"[{stamp}] {message}\n")
+        self._last_log_prefix = last_prefix
+        if replace_last_line:
+            self.log_text.delete('end-2l', 'end-1l')
+        self.log_text.insert(tk.END, ''.join(lines))
+        # Trim from the front so the widget never holds more than LOG_MAX_LINES
+        lines = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        if lines > LOG_MAX_LINES:
+            self.log_text.delete('1.0', f'{lines - LOG_MAX_LINES + 1}.0')
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    
+    def queue_log(self, message):
+        """Log from a worker or scanner thread - written by _drain_log_queue on the Tk thread"""
+        self.log_queue.append(message)
+    
+    def _drain_log_queue(self):
+        """Write queued log messages with one Text insert per poll"""
+        get = self.log_queue.popleft
+        messages = []
+        try:
+            for _ in range(STATUS_DRAIN_LIMIT):
+                messages.append(get())
+        except IndexError:
+            pass
+        try:
+            if messages:
+                self._write_log(messages)
+        finally:
+            # Come straight back if there's a backlog, otherwise poll at the normal rate
+            delay = 1 if self.log_queue else PROGRESS_POLL_MS
+            self.root.after(delay, self._drain_log_queue)
     
     def clear_log(self):
         """Clear the log area"""
         self.log_text.delete(1.0, tk.END)
+        self._last_log_prefix = None
         
     def browse_directory(self):
         """Browse for local directory"""
@@ -966,8 +2119,6 @@ class FTPDownloaderGUI:
             self.download_queue.put((file_path, local_path))
             # Track queued files
             with self.stats['lock']:
-                if 'queued_files' not in self.stats:
-                    self.stats['queued_files'] = 0
                 self.stats['queued_files'] += 1
             # Remove from failed tracking
             if file_path in self.failed_downloads_dict:
@@ -1085,55 +2236,68 @@ class FTPDownloaderGUI:
                 
                 # Connect to FTP server
                 if use_tls:
-                    ftp = ftplib.FTP_TLS()
-                    ftp.connect(host, port)
+                    ftp = TunedFTP_TLS()
+                    ftp.connect(host, port, timeout=TEST_CONNECTION_TIMEOUT)
                     ftp.login(username, password)
                     ftp.prot_p()
                 else:
-                    ftp = ftplib.FTP()
-                    ftp.connect(host, port)
+                    ftp = TunedFTP()
+                    ftp.connect(host, port, timeout=TEST_CONNECTION_TIMEOUT)
                     if username or password:
                         ftp.login(username, password)
                 
-                # Try to get server statistics (some servers support this)
-                stats_info = []
-                try:
-                    # Try STAT command (some servers provide stats)
-                    response = ftp.sendcmd('STAT')
-                    if response and len(response) > 0:
-                        stats_info.append(f"Server Status: {response[:200]}")
-                except:
-                    pass
-                
-                try:
-                    # Try SITE STAT (some servers support this)
-                    response = ftp.sendcmd('SITE STAT')
-                    if response and len(response) > 0:
-                        stats_info.append(f"SITE STAT: {response[:200]}")
-                except:
-                    pass
-                
-                try:
-                    # Try SYST to get server type
-                    syst = ftp.sendcmd('SYST')
-                    if syst:
-                        stats_info.append(f"Server Type: {syst}")
-                        # Check if it's PureFTPd
-                        if 'pure-ftpd' in syst.lower() or 'pureftpd' in syst.lower():
-                            stats_info.append("Detected PureFTPd - using optimized MLSD listing")
-                except:
-                    pass
-                
-                # Try PureFTPd specific features
-                try:
-                    # PureFTPd might support FEAT to see available features
-                    features = ftp.sendcmd('FEAT')
-                    if features and ('MLSD' in features or 'MLST' in features):
-                        stats_info.append("Server supports MLSD (Machine Listing) - optimal for directory scanning")
-                except:
-                    pass
+                # Try to get server statistics (some servers support this).
+                # The probes are sent back-to-back and the replies read in
+                # order, so they cost one round-trip instead of four
+                probes = ('STAT', 'SITE STAT', 'SYST', 'FEAT')
+                for command in probes:
+                    ftp.putcmd(command)
+                replies = {}
+                in_sync = True
+                for command in probes:
+                    try:
+                        replies[command] = ftp.getresp()
+                    except ftplib.error_perm:
+                        pass  # Not supported by this server
+                    except ftplib.all_errors:
+                        # Timed out, dropped, or an unexpected reply - the
+                        # remaining replies can't be matched to their commands
+                        in_sync = False
+                        break
                 
-                ftp.quit()
+                stats_info = []
+                # STAT and SITE STAT (some servers provide stats)
+                response = replies.get('STAT')
+                if response:
+                    stats_info.append(f"Server Status: {response[:200]}")
+                response = replies.get('SITE STAT')
+                if response:
+                    stats_info.append(f"SITE STAT: {response[:200]}")
+                
+                # SYST gives the server type
+                syst = replies.get('SYST')
+                if syst:
+                    stats_info.append(f"Server Type: {syst}")
+                    # Check if it's PureFTPd
+                    if 'pure-ftpd' in syst.lower() or 'pureftpd' in syst.lower():
+                        stats_info.append("Detected PureFTPd - using optimized MLSD listing")
+                
+                # PureFTPd might support FEAT to see available features
+                features = replies.get('FEAT')
+                if features and ('MLSD' in features or 'MLST' in features):
+                    stats_info.append("Server supports MLSD (Machine Listing) - optimal for directory scanning")
+                
+                if in_sync:
+                    # Keep the logged-in connection for the next scan, blocking
+                    # like the connections the scanners and workers open
+                    ftp.sock.settimeout(None)
+                    ftp.timeout = None
+                    self._park_idle_ftp(ftp, (host, port, username, password, use_tls))
+                else:
+                    try:
+                        ftp.close()
+                    except Exception:
+                        pass
                 
                 success_msg = f"✓ Connected to {host} successfully!"
                 if stats_info:
@@ -1141,24 +2305,55 @@ class FTPDownloaderGUI:
                 else:
                     success_msg += "\n\n(Server statistics not available - will count files during scan)"
                 
-                self.root.after(0, lambda: self.log(success_msg))
+                self.queue_log(success_msg)
                 self.root.after(0, lambda: self.test_connection_button.config(state=tk.NORMAL))
                 self.root.after(0, lambda msg=success_msg: messagebox.showinfo("Success", msg))
                 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda msg=error_msg: self.log(f"✗ Connection failed: {msg}"))
+                self.queue_log(f"✗ Connection failed: {error_msg}")
                 self.root.after(0, lambda: self.test_connection_button.config(state=tk.NORMAL))
                 self.root.after(0, lambda msg=error_msg: messagebox.showerror("Error", f"Connection failed: {msg}"))
         
         threading.Thread(target=test_thread, daemon=True).start()
     
+    def _park_idle_ftp(self, ftp, key):
+        """Keep a logged-in connection for reuse by the next scan or download with the same settings"""
+        with self._idle_ftp_lock:
+            self._idle_ftp.append((key, ftp))
+            excess = self._idle_ftp[:-IDLE_FTP_MAX]
+            del self._idle_ftp[:-IDLE_FTP_MAX]
+        for _, stale in excess:
+            try:
+                stale.close()
+            except Exception:
+                pass
+    
+    def _take_idle_ftp(self, key):
+        """Return a parked connection that matches key and still answers, else None"""
+        while True:
+            with self._idle_ftp_lock:
+                if not self._idle_ftp:
+                    return None
+                parked_key, ftp = self._idle_ftp.pop()
+            try:
+                if parked_key != key:
+                    raise ftplib.Error("settings changed")
+                ftp.voidcmd('NOOP')  # The server may have dropped it while idle
+                return ftp
+            except (ftplib.Error, OSError, EOFError):
+                try:
+                    ftp.close()
+                except Exception:
+                    pass
+    
     def scan_ftp_server(self):
         """Scan FTP server using ftplib to build complete file list with 1:1 structure"""
         self.test_connection_button.config(state=tk.DISABLED)
         self.log("Scanning FTP server to build complete file list (1:1 structure)...")
-        self.tree.delete(*self.tree.get_children())
+        # Existing rows stay until the scan finishes; _update_file_list reuses them
         self.file_list = []
+        self.file_list_set = set()
         
         def scan_thread():
             try:
@@ -1168,103 +2363,132 @@ class FTPDownloaderGUI:
                 password = self.password_entry.get()
                 remote_path = self.remote_path_entry.get().strip() or "/"
                 use_tls = self.use_tls_var.get()
+                num_scanners = max(1, self.scanners_var.get())
                 
-                # Connect to FTP server
-                if use_tls:
-                    ftp = ftplib.FTP_TLS()
-                    ftp.connect(host, port)
-                    ftp.login(username, password)
-                    ftp.prot_p()
-                else:
-                    ftp = ftplib.FTP()
-                    ftp.connect(host, port)
-                    if username or password:
+                def connect():
+                    if use_tls:
+                        ftp = TunedFTP_TLS()
+                        ftp.connect(host, port)
                         ftp.login(username, password)
+                        ftp.prot_p()
+                    else:
+                        ftp = TunedFTP()
+                        ftp.connect(host, port)
+                        if username or password:
+                            ftp.login(username, password)
+                    return ftp
                 
-                self.root.after(0, lambda: self.log(f"Connected to {host}, scanning entire server structure..."))
+                # Connect up front so connection errors are reported below,
+                # reusing a connection left by Test Connection or a previous scan
+                idle_key = (host, port, username, password, use_tls)
+                first_ftp = self._take_idle_ftp(idle_key) or connect()
                 
-                # Recursively scan directory - this will list EVERYTHING
-                self._scan_directory_ftp(ftp, remote_path, remote_path)
+                self.queue_log(f"Connected to {host}, scanning entire server structure with {num_scanners} connections...")
                 
-                ftp.quit()
+                # Each scanner owns a connection and pulls directories from the
+                # shared queue, so listing round-trips overlap
+                dir_queue = DirectoryQueue(remote_path, num_scanners)
+                
+                def scan_worker(ftp):
+                    try:
+                        if ftp is None:
+                            ftp = self._take_idle_ftp(idle_key) or connect()
+                        while True:
+                            current_path = dir_queue.get()
+                            if current_path is None:
+                                break  # Every queued directory has been listed
+                            try:
+                                self._scan_directory_ftp(ftp, current_path, remote_path, dir_queue)
+                            finally:
+                                dir_queue.task_done()
+                    except Exception as e:
+                        # The other scanners keep draining the queue
+                        self.queue_log(f"Scanner connection error: {str(e)}")
+                        if ftp is not None:
+                            try:
+                                ftp.close()
+                            except Exception:
+                                pass
+                            ftp = None
+                    finally:
+                        if ftp is not None:
+                            # Stay logged in for the download's scanners
+                            self._park_idle_ftp(ftp, idle_key)
+                
+                scanners = [threading.Thread(target=scan_worker, args=(first_ftp if i == 0 else None,), daemon=True)
+                            for i in range(num_scanners)]
+                for scanner in scanners:
+                    start_io_thread(scanner)
+                for scanner in scanners:
+                    scanner.join()
                 
                 # Update UI
                 file_count = len(self.file_list)
                 self.root.after(0, self._update_file_list)
                 self.root.after(0, lambda: self.test_connection_button.config(state=tk.NORMAL))
-                self.root.after(0, lambda: self.log(f"Scan complete! Found {file_count} files with exact server structure."))
+                self.queue_log(f"Scan complete! Found {file_count} files with exact server structure.")
                 self.root.after(0, lambda: self.download_button.config(state=tk.NORMAL))
                 
             except Exception as e:
                 import traceback
                 error_msg = str(e)
                 traceback_str = traceback.format_exc()
-                self.root.after(0, lambda: self.log(f"Scan error: {error_msg}"))
-                self.root.after(0, lambda: self.log(f"Traceback: {traceback_str}"))
+                self.queue_log(f"Scan error: {error_msg}")
+                self.queue_log(f"Traceback: {traceback_str}")
                 self.root.after(0, lambda: self.test_connection_button.config(state=tk.NORMAL))
                 self.root.after(0, lambda: messagebox.showerror("Error", f"Scan failed: {error_msg}"))
         
         threading.Thread(target=scan_thread, daemon=True).start()
     
-    def _scan_directory_ftp(self, ftp, current_path, base_path):
-        """Recursively scan FTP directory"""
+    def _scan_directory_ftp(self, ftp, current_path, base_path, dir_queue=None):
+        """Scan an FTP directory, walking its subdirectories here or queueing them on dir_queue"""
+        if dir_queue is None:
+            # Walk the subtree on this thread with an explicit stack
+            dir_queue = DirectoryStack()
+            self._scan_directory_ftp(ftp, current_path, base_path, dir_queue)
+            while dir_queue:
+                self._scan_directory_ftp(ftp, dir_queue.pop(), base_path, dir_queue)
+            return
         try:
-            if current_path != '/':
-                try:
-                    ftp.cwd(current_path)
-                except Exception as e:
-                    self.root.after(0, lambda: self.log(f"Warning: Could not access {current_path}: {str(e)}"))
-                    return
-            
-            items = []
             try:
-                # Try MLSD first (more reliable)
-                for item in ftp.mlsd():
-                    items.append(item)
-            except Exception as e1:
-                # Fallback to LIST
-                try:
-                    lines = []
-                    ftp.retrlines('LIST', lines.append)
-                    for line in lines:
-                        parts = line.split()
-                        if len(parts) >= 9:
-                            name = ' '.join(parts[8:])
-                            is_dir = parts[0].startswith('d')
-                            size = parts[4] if len(parts) > 4 else 'Unknown'
-                            items.append((name, {'type': 'dir' if is_dir else 'file', 'size': size}))
-                except Exception as e2:
-                    self.root.after(0, lambda: self.log(f"Warning: Could not list {current_path}: {str(e2)}"))
-                    return
+                # MLSD on the path if supported, CWD + LIST otherwise
+                items = list_ftp_directory(ftp, current_path)
+            except Exception as e:
+                self.queue_log(f"Warning: Could not list {current_path}: {str(e)}")
+                return
             
+            prefix = current_path.rstrip('/') + '/'  # Built once per directory; '/' for the root
+            rows = []  # (remote_path, size) of this directory's files
+            new_bytes = 0
             for name, info in items:
                 if name in ['.', '..']:
                     continue
                 
-                remote_path = os.path.join(current_path, name).replace('\\', '/')
+                remote_path = prefix + name
                 
                 if info.get('type') == 'dir':
-                    # Recursively scan subdirectory
-                    self._scan_directory_ftp(ftp, remote_path, base_path)
+                    # Another scanner connection may pick it up
+                    dir_queue.put(remote_path)
                 else:
-                    # Add file to list
                     size = info.get('size', 'Unknown')
-                    self.file_list.append((remote_path, size))
-                    # Update stats
-                    with self.stats['lock']:
-                        self.stats['total'] += 1
-                        # Add file size to total size (parse size - could be string or int)
-                        if isinstance(size, (int, float)):
-                            size_bytes = int(size)
-                        else:
-                            size_bytes = self._parse_size(size)
-                        self.stats['total_size'] += size_bytes
-                    # Update UI periodically
-                    if len(self.file_list) % 100 == 0:
-                        count = len(self.file_list)
-                        self.root.after(0, lambda c=count: self.log(f"Found {c} files so far..."))
+                    rows.append((remote_path, size))
+                    # Parse size - could be string or int
+                    new_bytes += self._parse_size(size)
+            
+            if rows:
+                # Publish the whole directory at once: one acquisition of each
+                # lock, and one treeview handoff instead of one per file
+                with self.file_list_lock:
+                    self.file_list.extend(rows)
+                    self.file_list_set.update(remote_path for remote_path, _ in rows)
+                with self.stats['lock']:
+                    self.stats['total'] += len(rows)
+                    self.stats['total_size'] += new_bytes
+                self.stats['dirty_event'].set()
+                # Show the rows while the scan runs; the drain also logs the running count
+                self._queue_tree_rows(rows)
         except Exception as e:
-            self.root.after(0, lambda: self.log(f"Error scanning {current_path}: {str(e)}"))
+            self.queue_log(f"Error scanning {current_path}: {str(e)}")
     
     def _try_recursive_list(self, ftp, remote_base, local_dir):
         """Try to use PureFTPd's recursive LIST -R command for faster scanning
@@ -1272,7 +2496,7 @@ class FTPDownloaderGUI:
         Returns True if successful and all files were discovered, False otherwise.
         """
         try:
-            self.root.after(0, lambda: self.log("Attempting recursive LIST -R (PureFTPd feature)..."))
+            self.queue_log("Attempting recursive LIST -R (PureFTPd feature)...")
             
             # Change to base directory
             if remote_base != '/':
@@ -1288,38 +2512,49 @@ class FTPDownloaderGUI:
                 # Try with -R flag for recursive listing and -a for all files (including hidden)
                 # This should get everything in one command
                 ftp.retrlines('LIST -R -a', lines.append)
-                self.root.after(0, lambda: self.log("Using LIST -R -a (recursive with hidden files)"))
+                self.queue_log("Using LIST -R -a (recursive with hidden files)")
             except:
                 try:
                     # Try just -R without -a (still recursive, but might miss hidden files)
                     ftp.retrlines('LIST -R', lines.append)
-                    self.root.after(0, lambda: self.log("Using LIST -R (recursive listing)"))
+                    self.queue_log("Using LIST -R (recursive listing)")
                 except:
                     try:
                         # If that fails, try without the space (some servers might need it differently)
                         ftp.retrlines('LIST-R', lines.append)
-                        self.root.after(0, lambda: self.log("Using LIST-R (alternative format)"))
+                        self.queue_log("Using LIST-R (alternative format)")
                     except Exception as e:
-                        self.root.after(0, lambda err=str(e): self.log(f"Recursive LIST not supported: {err}"))
+                        self.queue_log(f"Recursive LIST not supported: {str(e)}")
                         return False
             
             if not lines:
                 return False
             
-            self.root.after(0, lambda: self.log(f"Recursive LIST successful! Parsing {len(lines)} lines..."))
+            self.queue_log(f"Recursive LIST successful! Parsing {len(lines)} lines...")
             
             # Parse the recursive listing
             # PureFTPd recursive LIST format shows directory paths followed by their contents
             current_dir = remote_base.rstrip('/') or '/'
+            dir_prefix = current_dir.rstrip('/') + '/'  # Rebuilt only when a header changes current_dir
             files_found = 0
             dirs_found = set()
+            tasks = []  # Discovered downloads not yet counted and queued
+            new_bytes = 0
+            local_prefix = os.path.join(local_dir, '')
+            rel_prefix, local_dir_prefix = dir_path_prefixes(dir_prefix, local_prefix)
+            # Hot-loop lookups, bound once
+            downloaded_paths = self.stats['downloaded_paths']
+            downloading_paths = self.stats['downloading_paths']
+            file_list_set = self.file_list_set
+            file_sizes = self.file_sizes
+            local_index = self._local_index
             
             # Debug: log first few lines to understand the format
             if len(lines) > 0:
                 sample_lines = lines[:10] if len(lines) >= 10 else lines
-                self.root.after(0, lambda sample=sample_lines: self.log(f"Sample of first {len(sample)} lines from recursive listing (for debugging):"))
+                self.queue_log(f"Sample of first {len(sample_lines)} lines from recursive listing (for debugging):")
                 for i, sample_line in enumerate(sample_lines[:5]):  # Show first 5
-                    self.root.after(0, lambda sl=sample_line, idx=i: self.log(f"  [{idx}]: {sl[:100]}"))  # First 100 chars
+                    self.queue_log(f"  [{i}]: {sample_line[:100]}")  # First 100 chars
             
             for line in lines:
                 # Skip empty lines
@@ -1336,47 +2571,40 @@ class FTPDownloaderGUI:
                 line_stripped = line.strip()
                 
                 # Check if this looks like a directory path header (ends with ':' and doesn't look like a file entry)
-                if line_stripped.endswith(':'):
-                    potential_dir = line_stripped[:-1].strip()  # Remove trailing ':'
-                    # Skip if it looks like a file entry (starts with permissions like '-rw-' or 'drwx')
-                    # Directory headers don't start with file permissions
-                    if potential_dir and not (line_stripped.startswith('-') or 
-                                             line_stripped.startswith('d') or 
-                                             line_stripped.startswith('l') or
-                                             line_stripped.startswith('c') or
-                                             line_stripped.startswith('b') or
-                                             line_stripped.startswith('p') or
-                                             line_stripped.startswith('s') or
-                                             len(line_stripped.split()) > 1):  # File entries have multiple space-separated fields
-                        # This is likely a directory path header
-                        if potential_dir.startswith('/'):
-                            current_dir = potential_dir
-                        elif potential_dir.startswith('.'):
-                            # Handle relative paths starting with .
-                            if potential_dir == '.':
-                                current_dir = remote_base.rstrip('/') or '/'
-                            else:
-                                # Remove leading ./
-                                clean_path = potential_dir.lstrip('./')
-                                if remote_base == '/':
-                                    current_dir = f"/{clean_path}" if clean_path else '/'
-                                else:
-                                    current_dir = f"{remote_base.rstrip('/')}/{clean_path}".replace('//', '/') if clean_path else remote_base
+                header = _LIST_HEADER_RE.match(line_stripped)
+                if header:
+                    potential_dir = header.group(1)
+                    # This is likely a directory path header
+                    if potential_dir.startswith('/'):
+                        current_dir = potential_dir
+                    elif potential_dir.startswith('.'):
+                        # Handle relative paths starting with .
+                        if potential_dir == '.':
+                            current_dir = remote_base.rstrip('/') or '/'
                         else:
-                            # Relative path, make it absolute
+                            # Remove leading ./
+                            clean_path = potential_dir.lstrip('./')
                             if remote_base == '/':
-                                current_dir = f"/{potential_dir}" if potential_dir else '/'
+                                current_dir = f"/{clean_path}" if clean_path else '/'
                             else:
-                                current_dir = f"{remote_base.rstrip('/')}/{potential_dir}".replace('//', '/') if potential_dir else remote_base
-                        
-                        # Normalize the path
-                        current_dir = current_dir.replace('\\', '/').rstrip('/') or '/'
-                        dirs_found.add(current_dir)
-                        continue
+                                current_dir = f"{remote_base.rstrip('/')}/{clean_path}".replace('//', '/') if clean_path else remote_base
+                    else:
+                        # Relative path, make it absolute
+                        if remote_base == '/':
+                            current_dir = f"/{potential_dir}" if potential_dir else '/'
+                        else:
+                            current_dir = f"{remote_base.rstrip('/')}/{potential_dir}".replace('//', '/') if potential_dir else remote_base
+                    
+                    # Normalize the path
+                    current_dir = current_dir.replace('\\', '/').rstrip('/') or '/'
+                    dir_prefix = current_dir.rstrip('/') + '/'
+                    rel_prefix, local_dir_prefix = dir_path_prefixes(dir_prefix, local_prefix)
+                    dirs_found.add(current_dir)
+                    continue
                 
                 # Also check for directory headers without colon (some formats)
                 # If line doesn't start with permissions and doesn't have spaces, might be a path
-                if ':' not in line and not line_stripped.startswith(('-', 'd', 'l', 'c', 'b', 'p', 's')) and ' ' not in line_stripped:
+                if ':' not in line and not line_stripped.startswith(_LIST_MODE_CHARS) and ' ' not in line_stripped:
                     # Might be a directory path without colon - but be careful not to misidentify
                     # Only treat as directory if it looks like a path (contains /)
                     if '/' in line_stripped or line_stripped == '.' or line_stripped == '..':
@@ -1398,145 +2626,76 @@ class FTPDownloaderGUI:
                             else:
                                 current_dir = f"{remote_base.rstrip('/')}/{potential_dir}".replace('//', '/') if potential_dir else remote_base
                         current_dir = current_dir.replace('\\', '/').rstrip('/') or '/'
+                        dir_prefix = current_dir.rstrip('/') + '/'
+                        rel_prefix, local_dir_prefix = dir_path_prefixes(dir_prefix, local_prefix)
                         dirs_found.add(current_dir)
                         continue
                 
                 # Parse file/directory entry (starts with permissions like "drwxr-xr-x" or "-rw-r--r--")
-                # Try to parse as a file/directory entry
-                parts = line.split()
-                
-                # Check if this looks like a file entry (has permissions)
-                # File entries typically have at least 9 parts: permissions, links, owner, group, size, date, time, name
-                # But some formats might have fewer parts, so be more lenient
-                if len(parts) >= 5 and (parts[0].startswith('d') or parts[0].startswith('-') or 
-                                       parts[0].startswith('l') or parts[0].startswith('c') or 
-                                       parts[0].startswith('b') or parts[0].startswith('p') or 
-                                       parts[0].startswith('s')):
-                    # Extract name - it's usually the last part(s), but handle spaces in filenames
-                    # Try to find where the filename starts (usually after date/time)
-                    # Common format: permissions links owner group size month day time name
-                    # Or: permissions links owner group size date time name
-                    if len(parts) >= 9:
-                        # Standard format - name starts at index 8
-                        name = ' '.join(parts[8:])
-                    elif len(parts) >= 6:
-                        # Shorter format - name might be at the end
-                        # Try to detect: if parts[4] looks like a number (size), then parts[5+] is name
-                        try:
-                            int(parts[4])  # If this works, parts[4] is size
-                            name = ' '.join(parts[5:])
-                        except (ValueError, IndexError):
-                            # parts[4] is not a number, might be part of name
-                            name = ' '.join(parts[4:])
-                    else:
-                        # Very short format, just use last part as name
-                        name = parts[-1] if parts else ''
-                    
+                entry = parse_list_entry(line)
+                if entry is not None:
+                    is_dir, size, name = entry
                     if name in ['.', '..']:
                         continue
                     
-                    is_dir = parts[0].startswith('d')
-                    # Try to get size
-                    try:
-                        if len(parts) >= 5:
-                            size = parts[4]
-                            # Try to convert to int to verify it's a size
-                            int(size)
-                        else:
-                            size = 'Unknown'
-                    except (ValueError, IndexError):
-                        size = 'Unknown'
-                    
                     # Build full path
-                    if current_dir == '/':
-                        remote_path = f"/{name}"
-                    else:
-                        remote_path = f"{current_dir.rstrip('/')}/{name}"
-                    remote_path = remote_path.replace('\\', '/')
+                    remote_path = dir_prefix + name
                     
                     if is_dir:
                         # Add to scanned dirs to prevent re-scanning
                         dirs_found.add(remote_path)
-                        with self.scanned_dirs_lock:
-                            self.scanned_dirs.add(remote_path)
+                        self.scanned_dirs.add(remote_path)
                     else:
                         # It's a file - check if already processed before queueing
-                        with self.stats['lock']:
-                            # Check if already downloaded
-                            if 'downloaded_paths' in self.stats and remote_path in self.stats['downloaded_paths']:
-                                continue  # Skip already downloaded files
-                            
-                            # Check if currently downloading
-                            if 'downloading_paths' in self.stats and remote_path in self.stats['downloading_paths']:
-                                continue  # Skip files currently being downloaded
+                        if remote_path in downloaded_paths or remote_path in downloading_paths:
+                            continue  # Skip files already downloaded or currently downloading
                         
                         # Check if already in file_list (already queued)
-                        if any(fp == remote_path for fp, _ in self.file_list):
+                        if remote_path in file_list_set:
                             continue  # Skip files already in the list
                         
                         # Calculate local path
-                        if remote_path.startswith('/'):
-                            rel_path = remote_path[1:]
-                        else:
-                            rel_path = remote_path
-                        
-                        local_path = os.path.join(local_dir, rel_path)
+                        rel_path = rel_prefix + name
+                        local_path = local_dir_prefix + name
                         
                         # Check if file already exists locally
-                        if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                        if local_index.get(rel_path, 0) > 0:
                             # File already exists, mark as downloaded
-                            with self.stats['lock']:
-                                if 'downloaded_paths' not in self.stats:
-                                    self.stats['downloaded_paths'] = set()
-                                self.stats['downloaded_paths'].add(remote_path)
+                            downloaded_paths.add(remote_path)
                             continue  # Skip already existing files
                         
                         # Queue it
                         files_found += 1
-                        self.download_queue.put((remote_path, local_path))
-                        # Track queued files
-                        with self.stats['lock']:
-                            if 'queued_files' not in self.stats:
-                                self.stats['queued_files'] = 0
-                            self.stats['queued_files'] += 1
+                        size_bytes = self._parse_size(size)
+                        tasks.append((remote_path, local_path, size_bytes))
+                        new_bytes += size_bytes
                         
                         # Update file list
                         self.file_list.append((remote_path, size))
+                        self.file_list_set.add(remote_path)
                         
-                        # Update stats
-                        with self.stats['lock']:
-                            self.stats['total'] += 1
-                            # Add file size to total size (parse size - could be string or int)
-                            if isinstance(size, (int, float)):
-                                size_bytes = int(size)
-                            else:
-                                size_bytes = self._parse_size(size)
-                            self.stats['total_size'] += size_bytes
-                        
-                        # Batch UI updates
-                        if len(self.file_list) % 20 == 0:
-                            batch_files = self.file_list[-20:]
-                            self.root.after(0, lambda batch=batch_files: self._batch_add_files_to_treeview(batch))
+                        # No tree row until a worker starts on it
+                        file_sizes[remote_path] = size
                         
-                        # Log progress
+                        # Log progress, handing the files so far to the workers
                         if files_found % 200 == 0:
-                            self.root.after(0, lambda f=files_found: self.log(f"Discovered {f} files from recursive listing..."))
+                            self._publish_discovered(tasks, new_bytes)
+                            tasks = []
+                            new_bytes = 0
+                            self.queue_log(f"Discovered {files_found} files from recursive listing...")
             
-            # Add remaining files to treeview
-            if len(self.file_list) > 0:
-                remaining = self.file_list[len(self.file_list) - (len(self.file_list) % 20):]
-                if remaining:
-                    self.root.after(0, lambda batch=remaining: self._batch_add_files_to_treeview(batch))
+            if tasks:
+                self._publish_discovered(tasks, new_bytes)
             
             # Verify we got substantial results (sanity check)
             if files_found == 0 and len(dirs_found) <= 1:
                 # Might not have gotten everything, fall back to standard scanning
-                self.root.after(0, lambda: self.log("Warning: Recursive listing returned no files, falling back to standard scanning."))
+                self.queue_log("Warning: Recursive listing returned no files, falling back to standard scanning.")
                 return False
             
             # Log final count - use files_found which is accurate for this recursive listing
-            self.root.after(0, lambda f=files_found, d=len(dirs_found): self.log(f"Recursive listing complete! Found {f} files in {d} directories."))
-            self.root.after(0, lambda: self.log("Recursive listing succeeded - standard scanners will verify completeness and scan any missed directories."))
+            self.queue_log(f"Recursive listing complete! Found {files_found} files in {len(dirs_found)} directories.")
+            self.queue_log("Recursive listing succeeded - standard scanners will verify completeness and scan any missed directories.")
             
             # IMPORTANT: Don't mark directories as scanned - let standard scanners verify them
             # The recursive listing parser is unreliable and misses many files, so we must let
@@ -1545,243 +2704,246 @@ class FTPDownloaderGUI:
             # will catch any directories/files that were missed due to parsing issues
             
             # DO NOT mark directories as scanned - this would prevent standard scanners from processing them
-            # with self.scanned_dirs_lock:
-            #     for dir_path in dirs_found:
-            #         self.scanned_dirs.add(dir_path)
+            # for dir_path in dirs_found:
+            #     self.scanned_dirs.add(dir_path)
             
             return True  # Return True to indicate recursive listing worked, but scanners will still verify
             
         except Exception as e:
-            self.root.after(0, lambda: self.log(f"Recursive LIST failed, falling back to standard scanning: {str(e)}"))
+            self.queue_log(f"Recursive LIST failed, falling back to standard scanning: {str(e)}")
             return False
     
-    def _scan_and_queue_files_ftputil(self, ftp_host, current_path, base_path, local_dir, dir_queue=None):
-        """Recursively scan FTP directory using ftputil and queue files for download
+    def _list_directory_ftputil(self, ftp_host, current_path, prefix):
+        """List current_path as (subdirectory paths, (name, size) files), or None if it can't be listed"""
+        # Separate files and directories
+        dirs = []
+        files = []
+        
+        session = ftp_host._session
+        entries = None
+        if 'MLST' in get_server_features(session):
+            # One raw MLSD on the underlying session - no chdir, and no
+            # ftputil stat objects built per entry
+            try:
+                entries = mlsd_entries(session, current_path)
+            except Exception:
+                if 'MLST' in get_server_features(session):
+                    return None  # Can't list directory
+                # MLSD refused on this connection - use the ftputil listing below
         
-        If dir_queue is provided, directories are added to the queue for parallel processing.
-        Otherwise, directories are processed recursively in this thread.
-        """
-        try:
-            # Check if this directory has already been scanned (for parallel scanners)
-            if dir_queue is not None:
-                with self.scanned_dirs_lock:
-                    if current_path in self.scanned_dirs:
-                        return  # Already scanned by another scanner
-                    self.scanned_dirs.add(current_path)
-            
-            # Normalize path for ftputil (it works with absolute paths)
-            if not current_path.startswith('/'):
-                current_path = '/' + current_path
-            
+        if entries is not None:
+            for name, entry_type, size in entries:
+                if name in ['.', '..'] or entry_type in ('cdir', 'pdir'):
+                    continue
+                
+                if entry_type == 'dir':
+                    dirs.append(prefix + name)
+                else:
+                    files.append((name, size))
+        else:
             # Change to current directory
             try:
                 ftp_host.chdir(current_path)
             except Exception:
-                return  # Can't access this directory
+                return None  # Can't access this directory
             
             # Use ftputil's listdir to get directory contents
             try:
                 items = ftp_host.listdir(ftp_host.curdir)
             except Exception:
-                return  # Can't list directory
-            
-            # Separate files and directories
-            dirs = []
-            files = []
+                return None  # Can't list directory
             
             for name in items:
                 if name in ['.', '..']:
                     continue
                 
-                # Build full path
-                if current_path == '/':
-                    remote_path = f"/{name}"
-                else:
-                    remote_path = f"{current_path.rstrip('/')}/{name}"
-                remote_path = remote_path.replace('\\', '/')
-                
                 # Use ftputil's isfile/isdir to check type
                 # After chdir, we can use relative paths (just the name)
                 try:
                     if ftp_host.path.isdir(name):
-                        dirs.append(remote_path)
+                        dirs.append(prefix + name)
                     elif ftp_host.path.isfile(name):
                         # Get file size
                         try:
-                            size = ftp_host.path.getsize(name)
-                            files.append((remote_path, {'type': 'file', 'size': size}))
+                            files.append((name, ftp_host.path.getsize(name)))
                         except Exception:
-                            files.append((remote_path, {'type': 'file', 'size': 'Unknown'}))
+                            files.append((name, 'Unknown'))
                 except Exception:
                     # If we can't determine type, skip it
                     continue
+        
+        return dirs, files
+    
+    def _scan_and_queue_files_ftputil(self, ftp_host, current_path, base_path, local_dir, dir_queue=None):
+        """Scan FTP directory using ftputil and queue files for download
+        
+        If dir_queue is provided, directories are added to the queue for parallel processing.
+        Otherwise, the whole subtree is walked in this thread.
+        """
+        if dir_queue is None:
+            # Walk the subtree on this thread with an explicit stack
+            dir_queue = DirectoryStack()
+            self._scan_and_queue_files_ftputil(ftp_host, current_path, base_path, local_dir, dir_queue)
+            while dir_queue:
+                self._scan_and_queue_files_ftputil(ftp_host, dir_queue.pop(), base_path, local_dir, dir_queue)
+            return
+        try:
+            # Check if this directory has already been scanned (for parallel scanners)
+            if not isinstance(dir_queue, DirectoryStack):
+                if not self.scanned_dirs.add_if_absent(current_path):
+                    return  # Already scanned by another scanner
             
-            # Queue files first
-            for remote_path, info in files:
+            # Normalize path for ftputil (it works with absolute paths)
+            if not current_path.startswith('/'):
+                current_path = '/' + current_path
+            prefix = current_path.rstrip('/') + '/'  # Built once per directory; '/' for the root
+            rel_prefix, local_dir_prefix = dir_path_prefixes(prefix, os.path.join(local_dir, ''))
+            # Hot-loop lookups, bound once
+            downloaded_paths = self.stats['downloaded_paths']
+            downloading_paths = self.stats['downloading_paths']
+            file_list_set = self.file_list_set
+            file_sizes = self.file_sizes
+            local_index = self._local_index
+            
+            # A listing from the last LISTING_CACHE_TTL seconds spares the round
+            # trips when a retry or restart walks the same tree again
+            cached = self._listing_cache.get(current_path)
+            if cached is not None and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+                _, dirs, files = cached
+            else:
+                listing = self._list_directory_ftputil(ftp_host, current_path, prefix)
+                if listing is None:
+                    return  # Can't list directory
+                dirs, files = listing
+                self._listing_cache[current_path] = (time.monotonic(), dirs, files)
+            
+            # Queue files first; stats are published once for the whole directory
+            tasks = []
+            new_bytes = 0
+            for name, size in files:
+                remote_path = prefix + name
+                
                 # Check if file is already downloaded, downloading, or queued
-                with self.stats['lock']:
-                    # Check if already downloaded
-                    if 'downloaded_paths' in self.stats and remote_path in self.stats['downloaded_paths']:
-                        continue  # Skip already downloaded files
-                    
-                    # Check if currently downloading
-                    if 'downloading_paths' in self.stats and remote_path in self.stats['downloading_paths']:
-                        continue  # Skip files currently being downloaded
+                if remote_path in downloaded_paths or remote_path in downloading_paths:
+                    continue  # Skip files already downloaded or currently downloading
                 
                 # Check if already in file_list (already queued)
-                if any(fp == remote_path for fp, _ in self.file_list):
+                if remote_path in file_list_set:
                     continue  # Skip files already in the list
                 
                 # Calculate local path - preserve exact 1:1 structure
-                if remote_path.startswith('/'):
-                    rel_path = remote_path[1:]
-                else:
-                    rel_path = remote_path
-                
-                local_path = os.path.join(local_dir, rel_path)
+                rel_path = rel_prefix + name
+                local_path = local_dir_prefix + name
                 
                 # Check if file already exists locally
-                if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                if local_index.get(rel_path, 0) > 0:
                     # File already exists, mark as downloaded
-                    with self.stats['lock']:
-                        if 'downloaded_paths' not in self.stats:
-                            self.stats['downloaded_paths'] = set()
-                        self.stats['downloaded_paths'].add(remote_path)
+                    downloaded_paths.add(remote_path)
                     continue  # Skip already existing files
                 
-                # Add to queue
-                self.download_queue.put((remote_path, local_path))
-                # Track queued files
-                with self.stats['lock']:
-                    if 'queued_files' not in self.stats:
-                        self.stats['queued_files'] = 0
-                    self.stats['queued_files'] += 1
+                # Get raw size in bytes for total_size and the worker's progress
+                size_bytes = self._parse_size(size)
+                
+                tasks.append((remote_path, local_path, size_bytes))
+                new_bytes += size_bytes
                 
                 # Update file list for UI
-                size = info.get('size', 'Unknown')
-                # Get raw size in bytes for total_size calculation
-                size_bytes = self._parse_size(size) if not isinstance(size, (int, float)) else (int(size) if isinstance(size, (int, float)) else 0)
-                if isinstance(size, (int, float)):
-                    # Format size for display
-                    if size >= 1024 * 1024 * 1024:
-                        size_str = f"{size / (1024 * 1024 * 1024):.2f} GB"
-                    elif size >= 1024 * 1024:
-                        size_str = f"{size / (1024 * 1024):.2f} MB"
-                    elif size >= 1024:
-                        size_str = f"{size / 1024:.2f} KB"
-                    else:
-                        size_str = f"{size} B"
-                else:
-                    size_str = str(size)
+                size_str = self._format_size(size) if isinstance(size, (int, float)) else str(size)
                 
                 self.file_list.append((remote_path, size_str))
+                self.file_list_set.add(remote_path)
                 
-                # Increment total count when file is discovered (not when processed)
-                with self.stats['lock']:
-                    self.stats['total'] += 1
-                    # Add file size to total size (use raw bytes, not formatted string)
-                    self.stats['total_size'] += size_bytes
-                
-                # Batch UI updates for better performance (update every 20 files for less overhead)
-                if len(self.file_list) % 20 == 0:
-                    # Batch update UI
-                    batch_files = self.file_list[-20:]
-                    self.root.after(0, lambda batch=batch_files: self._batch_add_files_to_treeview(batch))
-                
-                # Log progress periodically (less frequent to reduce overhead)
-                if len(self.file_list) % 200 == 0:
-                    count = len(self.file_list)
-                    with self.stats['lock']:
-                        total_count = self.stats['total']
-                    self.root.after(0, lambda c=count, t=total_count: self.log(f"Discovered {c} files, queued for download... (Total: {t})"))
+                # No tree row until a worker starts on it
+                file_sizes[remote_path] = size_str
             
-            # Then recursively scan directories
-            if dir_queue is not None:
-                # Parallel scanning - add directories to queue
-                for remote_path in dirs:
-                    dir_queue.put(remote_path)
-            else:
-                # Sequential scanning - process directories recursively
-                for remote_path in dirs:
-                    self._scan_and_queue_files_ftputil(ftp_host, remote_path, base_path, local_dir, dir_queue)
+            # Count the directory's files once, then queue them
+            if tasks:
+                self._publish_discovered(tasks, new_bytes)
+                self._log_discovered()
+            
+            # Then queue the subdirectories
+            dir_queue.put_many(dirs)
                 
         except Exception as e:
             pass  # Silently continue on errors
     
     def _scan_and_queue_files(self, ftp, current_path, base_path, local_dir, dir_queue=None):
-        """Recursively scan FTP directory and queue files for download
+        """Scan FTP directory and queue files for download
         
         If dir_queue is provided, directories are added to the queue for parallel processing.
-        Otherwise, directories are processed recursively in this thread.
+        Otherwise, the whole subtree is walked in this thread.
         """
+        if dir_queue is None:
+            # Walk the subtree on this thread with an explicit stack
+            dir_queue = DirectoryStack()
+            self._scan_and_queue_files(ftp, current_path, base_path, local_dir, dir_queue)
+            while dir_queue:
+                self._scan_and_queue_files(ftp, dir_queue.pop(), base_path, local_dir, dir_queue)
+            return
         try:
             # Check if this directory has already been scanned (for parallel scanners)
-            if dir_queue is not None:
-                with self.scanned_dirs_lock:
-                    if current_path in self.scanned_dirs:
-                        return  # Already scanned by another scanner
-                    self.scanned_dirs.add(current_path)
-            
-            # Change to current directory
-            if current_path != '/':
+            if not isinstance(dir_queue, DirectoryStack):
+                if not self.scanned_dirs.add_if_absent(current_path):
+                    return  # Already scanned by another scanner
+            
+            items = None
+            # Try MLSD first (best for PureFTPd and modern servers - structured, reliable, has type/size)
+            # MLSD is more efficient than NLST+type checking for servers that support it
+            # FEAT is cached per connection, so servers without it skip straight to LIST
+            if 'MLST' in get_server_features(ftp):
+                try:
+                    # MLSD takes the path, saving a CWD round-trip per directory.
+                    # Facts were narrowed once per connection, so skip mlsd(facts=...)'s per-call OPTS
+                    items = [(name, {'type': entry_type, 'size': size})
+                             for name, entry_type, size in mlsd_entries(ftp, current_path)
+                             if entry_type not in ('cdir', 'pdir')]  # The listed directory and its parent
+                except ftplib.all_errors:
+                    pass  # Fall back to LIST below
+            if items is None:
+                # The fallbacks below list the current directory
+                items = []
                 try:
                     ftp.cwd(current_path)
-                except Exception as e:
+                except Exception:
                     return
-            else:
-                ftp.cwd('/')
-            
-            items = []
-            try:
-                # Try MLSD first (best for PureFTPd and modern servers - structured, reliable, has type/size)
-                # MLSD is more efficient than NLST+type checking for servers that support it
-                for item in ftp.mlsd(facts=['type', 'size']):
-                    items.append(item)
-            except:
-                # Fallback to NLST (fastest - just filenames, but requires type checking)
+                # Fallback to LIST - one command gives every entry's type and size
                 try:
-                    names = ftp.nlst()
-                    # Process in batch to reduce round trips
-                    for name in names:
-                        if name in ['.', '..']:
-                            continue
-                        # For speed, we'll determine type and size lazily
-                        # Just mark as unknown for now, we'll check type when needed
-                        items.append((name, {'type': 'unknown', 'size': 'Unknown'}))
-                except:
-                    # Final fallback to LIST (slowest, but most compatible)
+                    items = list_entries(ftp)
+                except Exception:
+                    pass
+                if not items:
+                    # Unparseable LIST format - NLST names, typed by the CWD probe below
                     try:
-                        lines = []
-                        ftp.retrlines('LIST', lines.append)
-                        for line in lines:
-                            parts = line.split()
-                            if len(parts) >= 9:
-                                name = ' '.join(parts[8:])
-                                is_dir = parts[0].startswith('d')
-                                size = parts[4] if len(parts) > 4 else 'Unknown'
-                                items.append((name, {'type': 'dir' if is_dir else 'file', 'size': size}))
+                        for name in ftp.nlst():
+                            if name in ['.', '..']:
+                                continue
+                            items.append((name, {'type': 'unknown', 'size': 'Unknown'}))
                     except:
                         return
             
             # Separate files and directories
             dirs = []
             files = []
+            prefix = current_path.rstrip('/') + '/'  # Built once per directory; '/' for the root
+            rel_prefix, local_dir_prefix = dir_path_prefixes(prefix, os.path.join(local_dir, ''))
+            # Hot-loop lookups, bound once
+            downloaded_paths = self.stats['downloaded_paths']
+            downloading_paths = self.stats['downloading_paths']
+            file_list_set = self.file_list_set
+            file_sizes = self.file_sizes
+            local_index = self._local_index
             
             for name, info in items:
                 if name in ['.', '..']:
                     continue
                 
                 # Build path preserving exact structure
-                if current_path == '/':
-                    remote_path = f"/{name}"
-                else:
-                    remote_path = f"{current_path.rstrip('/')}/{name}"
-                remote_path = remote_path.replace('\\', '/')
+                remote_path = prefix + name
                 
-                # If type is unknown (from NLST), check it quickly
+                # If type is unknown (NLST fallback only), check it
                 item_type = info.get('type', 'unknown')
                 if item_type == 'unknown':
-                    # Quick check: try to CWD into it (fastest way to check if dir)
+                    # Try to CWD into it - three round-trips, so LIST is tried first
                     try:
                         current_dir = ftp.pwd()
                         ftp.cwd(name)
@@ -1790,84 +2952,56 @@ class FTPDownloaderGUI:
                     except:
                         item_type = 'file'
                 
-                if item_type == 'dir' or item_type == 'cdir' or item_type == 'pdir':
+                if item_type == 'dir':
                     dirs.append(remote_path)
                 else:
-                    files.append((remote_path, info))
+                    files.append((name, info))
             
-            # Queue files first
-            for remote_path, info in files:
+            # Queue files first; stats are published once for the whole directory
+            tasks = []
+            new_bytes = 0
+            for name, info in files:
+                remote_path = prefix + name
+                
                 # Check if file is already downloaded, downloading, or queued
-                with self.stats['lock']:
-                    # Check if already downloaded
-                    if 'downloaded_paths' in self.stats and remote_path in self.stats['downloaded_paths']:
-                        continue  # Skip already downloaded files
-                    
-                    # Check if currently downloading
-                    if 'downloading_paths' in self.stats and remote_path in self.stats['downloading_paths']:
-                        continue  # Skip files currently being downloaded
+                if remote_path in downloaded_paths or remote_path in downloading_paths:
+                    continue  # Skip files already downloaded or currently downloading
                 
                 # Check if already in file_list (already queued)
-                if any(fp == remote_path for fp, _ in self.file_list):
+                if remote_path in file_list_set:
                     continue  # Skip files already in the list
                 
                 # Calculate local path - preserve exact 1:1 structure
-                if remote_path.startswith('/'):
-                    rel_path = remote_path[1:]
-                else:
-                    rel_path = remote_path
-                
-                local_path = os.path.join(local_dir, rel_path)
+                rel_path = rel_prefix + name
+                local_path = local_dir_prefix + name
                 
                 # Check if file already exists locally
-                if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+                if local_index.get(rel_path, 0) > 0:
                     # File already exists, mark as downloaded
-                    with self.stats['lock']:
-                        if 'downloaded_paths' not in self.stats:
-                            self.stats['downloaded_paths'] = set()
-                        self.stats['downloaded_paths'].add(remote_path)
+                    downloaded_paths.add(remote_path)
                     continue  # Skip already existing files
                 
-                # Add to queue
-                self.download_queue.put((remote_path, local_path))
-                # Track queued files
-                with self.stats['lock']:
-                    if 'queued_files' not in self.stats:
-                        self.stats['queued_files'] = 0
-                    self.stats['queued_files'] += 1
-                
-                # Update file list for UI
+                # Get raw size in bytes for total_size and the worker's progress
                 size = info.get('size', 'Unknown')
-                # Get raw size in bytes for total_size calculation
-                if isinstance(size, (int, float)):
-                    size_bytes = int(size)
-                else:
-                    size_bytes = self._parse_size(size)
+                size_bytes = self._parse_size(size)
                 
+                tasks.append((remote_path, local_path, size_bytes))
+                new_bytes += size_bytes
+                
+                # Update file list for UI
                 self.file_list.append((remote_path, size))
+                self.file_list_set.add(remote_path)
                 
-                # Increment total count when file is discovered (not when processed)
-                with self.stats['lock']:
-                    self.stats['total'] += 1
-                    # Add file size to total size (use raw bytes)
-                    self.stats['total_size'] += size_bytes
-                
-                # Batch UI updates for better performance (update every 20 files for less overhead)
-                if len(self.file_list) % 20 == 0:
-                    # Batch update UI
-                    batch_files = self.file_list[-20:]
-                    self.root.after(0, lambda batch=batch_files: self._batch_add_files_to_treeview(batch))
-                
-                # Log progress periodically (less frequent to reduce overhead)
-                if len(self.file_list) % 200 == 0:
-                    count = len(self.file_list)
-                    with self.stats['lock']:
-                        total_count = self.stats['total']
-                    self.root.after(0, lambda c=count, t=total_count: self.log(f"Discovered {c} files, queued for download... (Total: {t})"))
+                # No tree row until a worker starts on it
+                file_sizes[remote_path] = size
             
-            # Then recursively scan directories
-            for remote_path in dirs:
-                self._scan_and_queue_files(ftp, remote_path, base_path, local_dir)
+            # Count the directory's files once, then queue them
+            if tasks:
+                self._publish_discovered(tasks, new_bytes)
+                self._log_discovered()
+            
+            # Then queue the subdirectories
+            dir_queue.put_many(dirs)
                 
         except Exception as e:
             pass  # Silently continue on errors
@@ -1881,27 +3015,171 @@ class FTPDownloaderGUI:
             if hasattr(self, 'all_tree_items'):
                 self.all_tree_items.add(item_id)
     
+    def _publish_discovered(self, tasks, new_bytes):
+        """Count newly discovered (remote, local, size) tasks under one lock, then queue them"""
+        # Count before queueing so completed never runs ahead of total
+        with self.stats['lock']:
+            self.stats['total'] += len(tasks)
+            self.stats['total_size'] += new_bytes
+            self.stats['queued_files'] += len(tasks)
+        self.download_queue.put_many(tasks)
+        self.stats['dirty_event'].set()
+    
+    def _log_discovered(self, force=False):
+        """Log the discovered file count, at most once per DISCOVER_LOG_INTERVAL unless forced"""
+        now = time.monotonic()
+        if not force and now - self._last_discover_log < DISCOVER_LOG_INTERVAL:
+            return
+        self._last_discover_log = now
+        with self.stats['lock']:
+            total_count = self.stats['total']
+        self.queue_log(f"Discovered {len(self.file_list)} files, queued for download... (Total: {total_count})")
+    
+    def _queue_tree_rows(self, rows):
+        """Queue discovered (remote_path, size) rows for the treeview - thread-safe"""
+        self._pending_tree.extend(rows)
+        if not self._tree_drain_scheduled:
+            self._tree_drain_scheduled = True
+            self.root.after(TREEVIEW_DRAIN_MS, self._drain_pending_tree)
+    
+    def _drain_pending_tree(self):
+        """Insert up to TREEVIEW_BATCH_SIZE queued rows, rescheduling while rows remain"""
+        pending = self._pending_tree
+        batch = []
+        try:
+            for _ in range(TREEVIEW_BATCH_SIZE):
+                batch.append(pending.popleft())
+        except IndexError:
+            pass
+        # Files that finished while their row waited here only go to the
+        # completed/failed lists - a tree row would just be removed again
+        completed = self.completed_downloads
+        failed = self.failed_downloads_dict
+        if completed or failed:
+            batch = [row for row in batch if row[0] not in completed and row[0] not in failed]
+        try:
+            if batch:
+                self._batch_add_files_to_treeview(batch)
+                # Folded in here so a fast scan logs once per drain, not per file
+                self.log(f"Found {len(self.file_list)} files so far...")
+        finally:
+            # Clear the flag before re-checking, so a row queued in between
+            # either gets seen here or schedules its own drain
+            self._tree_drain_scheduled = False
+            if pending:
+                self._tree_drain_scheduled = True
+                self.root.after(TREEVIEW_DRAIN_MS, self._drain_pending_tree)
+    
     def _batch_add_files_to_treeview(self, file_batch):
-        """Add multiple files to treeview in a batch for better performance"""
-        for remote_path, size in file_batch:
-            if remote_path not in self.file_to_item:
-                item_id = self.tree.insert("", tk.END, text=remote_path, values=(size, "Pending", ""))
-                self.file_to_item[remote_path] = item_id
-                # Track for search filtering
-                if hasattr(self, 'all_tree_items'):
-                    self.all_tree_items.add(item_id)
+        """Add multiple files to treeview in a batch, holding back rows past TREEVIEW_MAX_ROWS"""
+        file_to_item = self.file_to_item
+        overflow = self._tree_overflow
+        room = TREEVIEW_MAX_ROWS - len(file_to_item)
+        # Dedupe the batch first, so the insert loop below is Tk calls only
+        new_rows = {}
+        for row in file_batch:
+            remote_path, size = row
+            if remote_path in file_to_item or remote_path in new_rows:
+                continue
+            if overflow or len(new_rows) >= room:
+                # Keep discovery order - inserted by _refill_treeview later
+                overflow.append(row)
+                continue
+            new_rows[remote_path] = size
+        if not new_rows:
+            return
+        
+        if file_to_item:
+            index, rows = tk.END, new_rows.items()
+        else:
+            # Empty tree: inserting in reverse at index 0 gives the same order
+            # without Tk walking the child list to find the end on every insert
+            index, rows = 0, reversed(new_rows.items())
+        insert = self.tree.insert
+        all_tree_items = self.all_tree_items
+        for remote_path, size in rows:
+            item_id = insert("", index, text=remote_path, values=(size, "Pending", ""))
+            file_to_item[remote_path] = item_id
+            # Track for search filtering
+            all_tree_items.add(item_id)
+    
+    def _refill_treeview(self):
+        """Insert held-back rows into the room left by removed rows"""
+        overflow = self._tree_overflow
+        file_to_item = self.file_to_item
+        downloaded_paths = self.stats['downloaded_paths']
+        while overflow and len(file_to_item) < TREEVIEW_MAX_ROWS:
+            remote_path, size = overflow.popleft()
+            # Skip rows that were shown or finished while waiting
+            if (remote_path in file_to_item or remote_path in downloaded_paths
+                    or remote_path in self.failed_downloads_dict):
+                continue
+            item_id = self.tree.insert("", tk.END, text=remote_path, values=(size, "Pending", ""))
+            file_to_item[remote_path] = item_id
+            self.all_tree_items.add(item_id)
     
     def _update_file_list(self):
-        """Update file list display (rebuilds entire list - used for initial scan)"""
-        self.tree.delete(*self.tree.get_children())
-        self.file_to_item = {}
+        """Update file list display after a scan, reusing the rows of files still listed"""
+        sizes = dict(self.file_list)
+        file_to_item = self.file_to_item
+        stale = []
+        for remote_path, item_id in file_to_item.items():
+            if remote_path in sizes:
+                # Reset in place - cheaper for Tk than delete + insert
+                self.tree.item(item_id, values=(sizes[remote_path], "Pending", ""), tags=())
+            else:
+                stale.append(remote_path)
+        for remote_path in stale:
+            item_id = file_to_item.pop(remote_path)
+            self.tree.delete(item_id)
+            self.all_tree_items.discard(item_id)
+        self._tree_overflow.clear()
         self.downloading_items_moved.clear()  # Reset tracking when rebuilding list
-        for remote_path, size in self.file_list:
-            item_id = self.tree.insert("", tk.END, text=remote_path, values=(size, "Pending", ""))
-            self.file_to_item[remote_path] = item_id
+        # Rows already shown are skipped
+        self._batch_add_files_to_treeview(self.file_list)
+    
+    def queue_file_status(self, remote_path, status, speed=None):
+        """Worker-side status_callback - queued and applied on the Tk thread"""
+        # deque.append is atomic - no lock or condition for workers to contend on
+        self.status_queue.append((remote_path, status, speed))
+    
+    def _drain_status_queue(self):
+        """Apply queued status updates, keeping only the latest one per file"""
+        latest = {}
+        get = self.status_queue.popleft
+        try:
+            for _ in range(STATUS_DRAIN_LIMIT):
+                remote_path, status, speed = get()
+                if speed is None and remote_path in latest:
+                    speed = latest[remote_path][1]  # Keep the last known speed
+                latest[remote_path] = (status, speed)
+        except IndexError:
+            pass
+        
+        try:
+            for remote_path, (status, speed) in latest.items():
+                self.update_file_status(remote_path, status, speed)
+            if self._completed_rows:
+                # One insert and one auto-scroll for the whole batch
+                self.completed_listbox.insert(tk.END, *self._completed_rows)
+                self.completed_listbox.see(tk.END)
+                self._completed_rows.clear()
+        finally:
+            # Come straight back if there's a backlog, otherwise poll at the normal rate
+            delay = 1 if self.status_queue else PROGRESS_POLL_MS
+            self.root.after(delay, self._drain_status_queue)
     
     def update_file_status(self, remote_path, status, speed=None):
         """Update the status of a file in the tree view and add to appropriate listbox"""
+        if "Downloading" in status and remote_path not in self.file_to_item:
+            # Queued files (and rows held back by TREEVIEW_MAX_ROWS) only get a
+            # row once a worker starts on them - inserted straight at the top
+            item_id = self.tree.insert("", 0, text=remote_path,
+                                       values=(self.file_sizes.get(remote_path, ""), status, speed or ""))
+            self.file_to_item[remote_path] = item_id
+            self.all_tree_items.add(item_id)
+            self.downloading_items_moved.add(remote_path)
+        
         if remote_path in self.file_to_item:
             item_id = self.file_to_item[remote_path]
             current_values = self.tree.item(item_id, 'values')
@@ -1932,17 +3210,11 @@ class FTPDownloaderGUI:
             # Move downloading files to the top
             if "Downloading" in status:
                 if remote_path not in self.downloading_items_moved:
-                    # Move to top (index 0)
+                    # Move to top (index 0) - once per file, no child-list scan needed
                     try:
-                        children = self.tree.get_children()
-                        if children and item_id in children:
-                            # Get current index
-                            current_index = children.index(item_id)
-                            if current_index > 0:
-                                # Move to top
-                                self.tree.move(item_id, "", 0)
-                                self.downloading_items_moved.add(remote_path)
-                    except:
+                        self.tree.move(item_id, "", 0)
+                        self.downloading_items_moved.add(remote_path)
+                    except tk.TclError:
                         pass  # Ignore errors if item doesn't exist or can't be moved
             
             # Remove from treeview if completed or failed (keep it in the dedicated listboxes)
@@ -1955,8 +3227,7 @@ class FTPDownloaderGUI:
         # Add to completed or failed listbox
         if status == "Completed":
             # Remove from failed downloads if it was retried
-            if remote_path in self.failed_downloads:
-                self.failed_downloads.remove(remote_path)
+            self.failed_downloads.discard(remote_path)
             if remote_path in self.failed_downloads_dict:
                 del self.failed_downloads_dict[remote_path]
                 # Remove from failed listbox
@@ -1969,13 +3240,12 @@ class FTPDownloaderGUI:
                     self.retry_failed_button.config(state=tk.DISABLED)
             
             if remote_path not in self.completed_downloads:
-                self.completed_downloads.append(remote_path)
-                self.completed_listbox.insert(tk.END, remote_path)
-                # Auto-scroll to bottom
-                self.completed_listbox.see(tk.END)
+                self.completed_downloads.add(remote_path)
+                # Added to the listbox by _drain_status_queue, once per batch
+                self._completed_rows.append(remote_path)
         elif status.startswith("Failed"):
             if remote_path not in self.failed_downloads:
-                self.failed_downloads.append(remote_path)
+                self.failed_downloads.add(remote_path)
                 # Calculate local path for retry
                 local_dir = self.local_dir_entry.get().strip()
                 if remote_path.startswith('/'):
@@ -2000,12 +3270,9 @@ class FTPDownloaderGUI:
                     self.download_queue.put((remote_path, local_path))
                     # Track queued files
                     with self.stats['lock']:
-                        if 'queued_files' not in self.stats:
-                            self.stats['queued_files'] = 0
                         self.stats['queued_files'] += 1
                     # Remove from failed list temporarily (will be re-added if it fails again)
-                    if remote_path in self.failed_downloads:
-                        self.failed_downloads.remove(remote_path)
+                    self.failed_downloads.discard(remote_path)
                     if remote_path in self.failed_downloads_dict:
                         del self.failed_downloads_dict[remote_path]
                     # Remove from listbox
@@ -2033,9 +3300,7 @@ class FTPDownloaderGUI:
                         # Remove failed tag
                         self.tree.item(item_id, tags=())
                     # Remove from downloaded_paths so it can be retried
-                    with self.stats['lock']:
-                        if 'downloaded_paths' in self.stats:
-                            self.stats['downloaded_paths'].discard(remote_path)
+                    self.stats['downloaded_paths'].discard(remote_path)
                     self.log(f"Auto-retrying failed download: {remote_path}")
     
     def retry_failed_downloads(self):
@@ -2054,8 +3319,7 @@ class FTPDownloaderGUI:
         # Re-queue all failed downloads
         for remote_path, local_path in list(self.failed_downloads_dict.items()):
             # Remove from failed tracking
-            if remote_path in self.failed_downloads:
-                self.failed_downloads.remove(remote_path)
+            self.failed_downloads.discard(remote_path)
             
             # Remove from failed listbox
             for i in range(self.failed_listbox.size() - 1, -1, -1):  # Iterate backwards to avoid index issues
@@ -2066,8 +3330,6 @@ class FTPDownloaderGUI:
             self.download_queue.put((remote_path, local_path))
             # Track queued files
             with self.stats['lock']:
-                if 'queued_files' not in self.stats:
-                    self.stats['queued_files'] = 0
                 self.stats['queued_files'] += 1
             
             # Re-add to treeview as pending if not already there
@@ -2091,9 +3353,8 @@ class FTPDownloaderGUI:
                 self.tree.item(item_id, tags=())
             
             # Remove from downloaded_paths so it can be retried
+            self.stats['downloaded_paths'].discard(remote_path)
             with self.stats['lock']:
-                if 'downloaded_paths' in self.stats:
-                    self.stats['downloaded_paths'].discard(remote_path)
                 # Reset stats for retry
                 if remote_path in [err.split(':')[0] for err in self.stats.get('errors', [])]:
                     # Remove error for this file
@@ -2105,10 +3366,9 @@ class FTPDownloaderGUI:
         # Disable retry button
         self.retry_failed_button.config(state=tk.DISABLED)
         
-        # Update failed count in stats
-        with self.stats['lock']:
-            # Adjust failed count (subtract retried files)
-            self.stats['failed'] = max(0, self.stats['failed'] - retry_count)
+        # The retried files are pending again - drop them from the failed count
+        for worker in self.stats['worker_counters']:
+            worker.files_failed = 0
         
         self.log(f"Queued {retry_count} files for retry. Click 'Start Download' to begin.")
         messagebox.showinfo("Retry", f"Queued {retry_count} failed downloads for retry. Click 'Start Download' to begin.")
@@ -2123,288 +3383,7 @@ class FTPDownloaderGUI:
             self.downloading_items_moved.discard(remote_path)
             if hasattr(self, 'all_tree_items'):
                 self.all_tree_items.discard(item_id)
-    
-    def update_progress(self):
-        """Update progress bar and stats"""
-        if not self.is_downloading:
-            return
-        
-        with self.stats['lock']:
-            total = self.stats['total']
-            completed = self.stats['completed']
-            success = self.stats['success']
-            failed = self.stats['failed']
-        
-        # Check if all workers are done, queue is empty, scanner is done, and no files are downloading
-        queue_empty = self.download_queue.empty()
-        all_done = all(not worker.is_alive() for worker in self.workers) if self.workers else False
-        
-        # Check if there are any files currently being downloaded or in queue
-        with self.stats['lock']:
-            downloading_count = len(self.stats.get('downloading_paths', set()))
-            # Also check queue size (approximate, since we can't lock the queue)
-            queue_size = self.download_queue.qsize()
-        
-        # Only mark as complete if ALL of these conditions are met:
-        # 1. Scanner has finished discovering files (no more files will be added)
-        # 2. Queue is completely empty (no files waiting to be processed)
-        # 3. All workers are done (no active worker threads)
-        # 4. No files are currently being downloaded (downloading_paths is empty)
-        # 5. We have discovered at least some files
-        # 6. All discovered files have been processed (completed >= total)
-        is_complete = (self.scanner_done and 
-                      queue_empty and 
-                      queue_size == 0 and
-                      all_done and 
-                      downloading_count == 0 and 
-                      total > 0 and 
-                      completed >= total)
-        
-        # Calculate and update download speed
-        current_time = time.time()
-        speed = 0.0
-        speed_str = "0 B/s"
-        
-        with self.stats['lock']:
-            bytes_downloaded = self.stats.get('bytes_downloaded', 0)
-            last_bytes = self.stats.get('last_bytes', 0)
-            last_speed_time = self.stats.get('last_speed_time')
-            
-            # Initialize last_speed_time if not set
-            if last_speed_time is None:
-                last_speed_time = current_time
-                self.stats['last_speed_time'] = current_time
-                self.stats['last_bytes'] = 0
-            
-            # Calculate speed over last 2 seconds
-            time_diff = current_time - last_speed_time
-            if time_diff >= 2.0:  # Update speed every 2 seconds
-                bytes_diff = bytes_downloaded - last_bytes
-                speed = bytes_diff / time_diff if time_diff > 0 else 0
-                self.stats['current_speed'] = speed
-                self.stats['last_bytes'] = bytes_downloaded
-                self.stats['last_speed_time'] = current_time
-            else:
-                # Use cached speed if not enough time has passed
-                speed = self.stats.get('current_speed', 0)
-        
-        # Format speed (always show, even if 0)
-        if speed >= 1024 * 1024:
-            speed_str = f"{speed / (1024 * 1024):.1f} MB/s"
-        elif speed >= 1024:
-            speed_str = f"{speed / 1024:.1f} KB/s"
-        else:
-            speed_str = f"{speed:.0f} B/s"
-        
-        # Get total size and format it
-        with self.stats['lock']:
-            total_size = self.stats.get('total_size', 0)
-            bytes_downloaded = self.stats.get('bytes_downloaded', 0)
-        total_size_str = self._format_size(total_size) if total_size > 0 else "Unknown"
-        
-        # Calculate progress percentage
-        progress_percent = 0.0
-        if total_size > 0:
-            progress_percent = (bytes_downloaded / total_size) * 100
-        progress_str = f"{progress_percent:.1f}%" if total_size > 0 else "N/A"
-        
-        # Calculate ETA (time remaining)
-        eta_str = "N/A"
-        if speed > 0 and total_size > 0:
-            remaining_bytes = total_size - bytes_downloaded
-            if remaining_bytes > 0:
-                eta_seconds = remaining_bytes / speed
-                if eta_seconds < 60:
-                    eta_str = f"{int(eta_seconds)}s"
-                elif eta_seconds < 3600:
-                    eta_str = f"{int(eta_seconds / 60)}m {int(eta_seconds % 60)}s"
-                else:
-                    hours = int(eta_seconds / 3600)
-                    minutes = int((eta_seconds % 3600) / 60)
-                    eta_str = f"{hours}h {minutes}m"
-        
-        # Calculate pending files (total - completed - failed)
-        pending = max(0, total - completed - failed)
-        
-        # Update stats (always include speed, total size, progress, and ETA)
-        self.stats_var.set(f"Files: {total} | Total Size: {total_size_str} | Progress: {progress_str} | ETA: {eta_str} | Completed: {completed} | Pending: {pending} | Failed: {failed} | Speed: {speed_str}")
-        
-        if is_complete:
-            # Increment consecutive completion checks
-            self.completion_checks_passed += 1
-            
-            # Require 5 consecutive successful checks (each 1 second apart) before final verification
-            # This ensures downloads are truly done and gives time for any pending operations
-            if self.completion_checks_passed >= 5:
-                # Multiple checks passed, now do final verification
-                self.root.after(2000, self._final_completion_check)  # Wait 2 more seconds before final check
-            else:
-                # Not enough consecutive checks yet, continue monitoring
-                self.root.after(1000, self.update_progress)
-        else:
-            # Reset counter if not complete - any activity resets the count
-            self.completion_checks_passed = 0
-            # Schedule next update (always update status bar)
-            self.root.after(500, self.update_progress)
-    
-    def _final_completion_check(self):
-        """Final check to ensure download is really complete - verify multiple times with thorough checks"""
-        if not self.is_downloading:
-            return
-        
-        # Do multiple checks with delays to ensure nothing is still downloading
-        def verify_complete(attempt=0, max_attempts=5):
-            if not self.is_downloading:
-                return
-            
-            # Check queue status
-            queue_empty = self.download_queue.empty()
-            queue_size = self.download_queue.qsize()
-            
-            # Check worker status
-            all_done = all(not worker.is_alive() for worker in self.workers) if self.workers else False
-            
-            # Check downloading paths and stats
-            with self.stats['lock']:
-                downloading_count = len(self.stats.get('downloading_paths', set()))
-                total = self.stats['total']
-                completed = self.stats['completed']
-                success = self.stats['success']
-                failed = self.stats['failed']
-                errors = self.stats['errors']
-            
-            # Additional check: see if any files in treeview are still downloading
-            files_still_downloading = False
-            try:
-                for item_id in self.tree.get_children():
-                    values = self.tree.item(item_id, 'values')
-                    if values and len(values) > 1:
-                        status = values[1]
-                        if status and "Downloading" in status:
-                            files_still_downloading = True
-                            break
-            except:
-                pass
-            
-            # Comprehensive completion check
-            is_still_complete = (self.scanner_done and 
-                                queue_empty and 
-                                queue_size == 0 and
-                                all_done and 
-                                downloading_count == 0 and 
-                                not files_still_downloading and
-                                total > 0 and 
-                                completed >= total)
-            
-            if is_still_complete:
-                if attempt < max_attempts - 1:
-                    # Check again after a delay (longer delay for later attempts)
-                    delay = 2000 if attempt >= 2 else 1000
-                    self.root.after(delay, lambda: verify_complete(attempt + 1, max_attempts))
-                else:
-                    # All checks passed, we're truly done
-                    # One final verification
-                    final_queue_empty = self.download_queue.empty()
-                    final_queue_size = self.download_queue.qsize()
-                    final_all_done = all(not worker.is_alive() for worker in self.workers) if self.workers else False
-                    
-                    with self.stats['lock']:
-                        final_downloading_count = len(self.stats.get('downloading_paths', set()))
-                        final_total = self.stats['total']
-                        final_completed = self.stats['completed']
-                        final_success = self.stats['success']
-                        final_failed = self.stats['failed']
-                        final_errors = self.stats['errors']
-                    
-                    # One more check
-                    if (self.scanner_done and 
-                        final_queue_empty and 
-                        final_queue_size == 0 and
-                        final_all_done and 
-                        final_downloading_count == 0 and 
-                        final_total > 0 and 
-                        final_completed >= final_total):
-                        
-                        # Now disable downloading and re-enable buttons
-                        self.is_downloading = False
-                        self.completion_checks_passed = 0
-                        self.download_button.config(state=tk.NORMAL)
-                        self.stop_button.config(state=tk.DISABLED)
-                        self.test_connection_button.config(state=tk.NORMAL)
-                        # Enable retry button if there are failed downloads
-                        if self.failed_downloads_dict:
-                            self.retry_failed_button.config(state=tk.NORMAL)
-                        else:
-                            self.retry_failed_button.config(state=tk.DISABLED)
-                        # Enable retry button if there are failed downloads
-                        if self.failed_downloads_dict:
-                            self.retry_failed_button.config(state=tk.NORMAL)
-                        else:
-                            self.retry_failed_button.config(state=tk.DISABLED)
-                        
-                        # Calculate final speed
-                        final_speed = 0.0
-                        final_speed_str = "0 B/s"
-                        final_time = time.time()
-                        with self.stats['lock']:
-                            final_bytes = self.stats.get('bytes_downloaded', 0)
-                            start_time = self.stats.get('download_start_time')
-                            if start_time:
-                                elapsed = final_time - start_time
-                                if elapsed > 0:
-                                    final_speed = final_bytes / elapsed
-                        
-                        if final_speed >= 1024 * 1024:
-                            final_speed_str = f"{final_speed / (1024 * 1024):.1f} MB/s"
-                        elif final_speed >= 1024:
-                            final_speed_str = f"{final_speed / 1024:.1f} KB/s"
-                        else:
-                            final_speed_str = f"{final_speed:.0f} B/s"
-                        
-                        # Get final total size and format it
-                        with self.stats['lock']:
-                            final_total_size = self.stats.get('total_size', 0)
-                        final_total_size_str = self._format_size(final_total_size) if final_total_size > 0 else "Unknown"
-                        
-                        # Update stats one final time (include speed and total size)
-                        # Calculate final progress
-                        with self.stats['lock']:
-                            final_total_size = self.stats.get('total_size', 0)
-                            final_bytes_downloaded = self.stats.get('bytes_downloaded', 0)
-                        final_progress_percent = 0.0
-                        if final_total_size > 0:
-                            final_progress_percent = (final_bytes_downloaded / final_total_size) * 100
-                        final_progress_str = f"{final_progress_percent:.1f}%" if final_total_size > 0 else "N/A"
-                        
-                        final_pending = max(0, final_total - final_completed - final_failed)
-                        self.stats_var.set(f"Files: {final_total} | Total Size: {final_total_size_str} | Progress: {final_progress_str} | Completed: {final_completed} | Pending: {final_pending} | Failed: {final_failed} | Speed: {final_speed_str}")
-                        
-                        if final_errors:
-                            self.log(f"Download complete with {len(final_errors)} errors")
-                        else:
-                            self.log("Download complete!")
-                        
-                        # Only show dialog once
-                        if not self.completion_dialog_shown:
-                            self.completion_dialog_shown = True
-                            # Show tray notification
-                            self._show_tray_notification(
-                                "Download Complete",
-                                f"Completed: {final_completed}, Failed: {final_failed}",
-                                duration=10
-                            )
-                            messagebox.showinfo("Complete", f"Download finished!\nCompleted: {final_completed}\nFailed: {final_failed}")
-                    else:
-                        # Final check failed, continue monitoring
-                        self.completion_checks_passed = 0
-                        self.update_progress()
-            else:
-                # Not complete, reset counter and continue monitoring
-                self.completion_checks_passed = 0
-                self.update_progress()
-        
-        # Start verification process
-        verify_complete()
+            self._refill_treeview()
     
     def start_download(self):
         """Start recursive download of entire FTP server using multiple FTP connections"""
@@ -2437,37 +3416,30 @@ class FTPDownloaderGUI:
         # Reset stats
         with self.stats['lock']:
             self.stats['total'] = 0  # Will update as files are discovered
-            self.stats['completed'] = 0
-            self.stats['success'] = 0
-            self.stats['failed'] = 0
             self.stats['errors'] = []
-            self.stats['bytes_downloaded'] = 0
+            self.stats['worker_counters'] = []
             self.stats['total_size'] = 0  # Total size of all files to download
             self.stats['queued_files'] = 0  # Count of files that have been queued
             self.stats['download_start_time'] = time.time()
-            self.stats['last_bytes'] = 0
-            self.stats['last_speed_time'] = time.time()
-            self.stats['current_speed'] = 0.0
-            # Shared sets to track downloaded and downloading paths across workers
-            if 'downloaded_paths' not in self.stats:
-                self.stats['downloaded_paths'] = set()
-            if 'downloading_paths' not in self.stats:
-                self.stats['downloading_paths'] = set()
+            self.stats['speed_samples'] = collections.deque([(time.monotonic(), 0)])
         
         # Clear completed and failed listboxes
         self.completed_listbox.delete(0, tk.END)
         self.failed_listbox.delete(0, tk.END)
-        self.completed_downloads = []
-        self.failed_downloads = []
+        self.completed_downloads = set()
+        self.failed_downloads = set()
         self.failed_downloads_dict.clear()
         self.retry_failed_button.config(state=tk.DISABLED)
         # Reset search tracking
         if hasattr(self, 'all_tree_items'):
             self.all_tree_items.clear()
+        self._tree_overflow.clear()
+        self.file_sizes = {}
         
-        # Reset completion tracking
+        # Reset completion tracking (a fresh event, so a previous run's watcher can't set it)
         self.completion_dialog_shown = False
-        self.completion_checks_passed = 0
+        self.status_var.set("")
+        self.done_event = threading.Event()
         self.downloading_items_moved.clear()  # Reset downloading items tracking
         
         self.log(f"Starting recursive download with {num_threads} parallel download workers")
@@ -2491,51 +3463,78 @@ class FTPDownloaderGUI:
         self.recursive_list_attempted = False  # Track if we've tried it
         self.recursive_list_succeeded = False  # Track if recursive listing worked
         
+        # Index the local directory in the background; scanners wait for it
+        # before checking which files already exist
+        self._local_index_ready.clear()
+        
+        def index_local_dir():
+            try:
+                self._local_index = build_local_index(local_dir)
+            except Exception:
+                self._local_index = {}  # Workers still skip files they find on disk
+            finally:
+                self._local_index_ready.set()
+        
+        threading.Thread(target=index_local_dir, daemon=True).start()
+        
         # Directory queue for parallel scanners to coordinate
-        dir_queue = queue.Queue()
-        dir_queue.put(remote_base)  # Start with base directory
+        dir_queue = DirectoryQueue(remote_base, num_scanners)  # Start with base directory
+        self.dir_queue = dir_queue
         
         # Set downloading flag first
         self.is_downloading = True
         
+        # Connections are pooled per server/login; scanners and workers take
+        # from and return to the same pool
+        idle_key = (host, port, username, password, use_tls)
+        if self._listing_cache_key != idle_key:
+            # Listings of another server (or login) don't apply
+            self._listing_cache = {}
+            self._listing_cache_key = idle_key
+        
         # Start download workers first (they'll wait for queue items)
+        self.download_queue.resize(num_threads)
         self.workers = []
         for i in range(num_threads):
             worker = DownloadWorker(i, self.download_queue, self.stats, host, port,
-                                   local_dir, self.on_file_progress, self.update_file_status,
-                                   username, password, use_tls, remote_base)
-            worker.start()
+                                   local_dir, self.on_file_progress, self.queue_file_status,
+                                   username, password, use_tls, remote_base,
+                                   take_connection=lambda: self._take_idle_ftp(idle_key),
+                                   park_connection=lambda ftp: self._park_idle_ftp(ftp, idle_key),
+                                   log_callback=self.queue_log)
+            start_io_thread(worker)
             self.workers.append(worker)
             self.log(f"Download worker {i} started")
         
-        # Start regular progress updates
-        self.update_progress()
-        
         # Start multiple scanner threads to discover files in parallel
         def scanner_thread(scanner_id):
             try:
                 # Create ftputil connection using the same custom session factory
                 if use_tls:
                     session_factory = create_no_utf8_session_factory(
-                        base_class=ftplib.FTP_TLS,
+                        base_class=TunedFTP_TLS,
                         port=port,
                         use_passive_mode=True,
                         encrypt_data_channel=True
                     )
                 else:
                     session_factory = create_no_utf8_session_factory(
-                        base_class=ftplib.FTP,
+                        base_class=TunedFTP,
                         port=port,
                         use_passive_mode=True,
                         encrypt_data_channel=False
                     )
                 
-                scan_host = ftputil.FTPHost(host, username, password, session_factory=session_factory)
+                def reuse_or_connect(*args):
+                    # Start from a connection an earlier scan or download left logged in, if any
+                    return self._take_idle_ftp(idle_key) or session_factory(*args)
+                
+                scan_host = ftputil.FTPHost(host, username, password, session_factory=reuse_or_connect)
                 
                 with self.scanner_count_lock:
                     self.scanner_count += 1
                 
-                self.root.after(0, lambda sid=scanner_id: self.log(f"Scanner {sid} connected, discovering files..."))
+                self.queue_log(f"Scanner {scanner_id} connected, discovering files...")
                 
                 # Try recursive LIST for PureFTPd (only first scanner attempts this)
                 # Use ftplib directly for this since it's a server-specific feature
@@ -2544,12 +3543,12 @@ class FTPDownloaderGUI:
                     # Create a temporary ftplib connection for recursive LIST
                     try:
                         if use_tls:
-                            temp_ftp = ftplib.FTP_TLS()
+                            temp_ftp = TunedFTP_TLS()
                             temp_ftp.connect(host, port)
                             temp_ftp.login(username, password)
                             temp_ftp.prot_p()
                         else:
-                            temp_ftp = ftplib.FTP()
+                            temp_ftp = TunedFTP()
                             temp_ftp.connect(host, port)
                             if username or password:
                                 temp_ftp.login(username, password)
@@ -2557,58 +3556,52 @@ class FTPDownloaderGUI:
                         if self._try_recursive_list(temp_ftp, remote_base, local_dir):
                             # Recursive listing succeeded
                             self.recursive_list_succeeded = True
-                            self.root.after(0, lambda: self.log("Recursive listing completed, standard scanners will verify completeness."))
+                            self.queue_log("Recursive listing completed, standard scanners will verify completeness.")
                         temp_ftp.quit()
                     except Exception as e:
                         # If recursive LIST fails, continue with standard scanning
                         pass
                 
+                self._local_index_ready.wait()
+                
                 # Process directories from queue
-                while True:
-                    
-                    try:
-                        # Get next directory with shorter timeout for faster response
-                        current_path = dir_queue.get(timeout=0.5)
-                    except queue.Empty:
-                        # Check if we're done (no more directories and other scanners are done)
-                        with self.scanner_count_lock:
-                            if dir_queue.empty() and self.scanner_count <= 1:
-                                # Last scanner, we're done
-                                break
-                            elif dir_queue.empty():
-                                # Wait a bit and check again
-                                continue
+                while self.is_downloading:
+                    # None once every queued directory has been scanned. A scanner
+                    # queues a directory's subdirectories before marking it done,
+                    # so an idle pool can't miss work another scanner is producing
+                    current_path = dir_queue.get()
+                    if current_path is None:
+                        break
                     
                     # Scan this directory using ftputil
-                    self._scan_and_queue_files_ftputil(scan_host, current_path, remote_base, local_dir, dir_queue)
-                    dir_queue.task_done()
-                
-                # Add any remaining files to treeview
-                if len(self.file_list) > 0:
-                    remaining = self.file_list[len(self.file_list) - (len(self.file_list) % 20):]
-                    if remaining:
-                        self.root.after(0, lambda batch=remaining: self._batch_add_files_to_treeview(batch))
+                    try:
+                        self._scan_and_queue_files_ftputil(scan_host, current_path, remote_base, local_dir, dir_queue)
+                    finally:
+                        dir_queue.task_done()
                 
-                scan_host.close()
+                # Keep the logged-in session for the next scan or download
+                session = detach_ftp_session(scan_host)
+                if session is not None:
+                    self._park_idle_ftp(session, idle_key)
                 
                 with self.scanner_count_lock:
                     self.scanner_count -= 1
                     if self.scanner_count == 0:
-                        # Last scanner finished
-                        self.root.after(0, lambda: self.log("All scanners finished discovering files"))
+                        # Last scanner finished - the throttled count may be stale
+                        self._log_discovered(force=True)
+                        self.queue_log("All scanners finished discovering files")
                         self.scanner_done = True
                         # Add poison pills to stop workers when queue is empty
-                        for _ in range(num_threads):
-                            self.download_queue.put(None)
+                        self.download_queue.put_many([None] * num_threads)
                     else:
-                        self.root.after(0, lambda sid=scanner_id: self.log(f"Scanner {sid} finished"))
+                        self.queue_log(f"Scanner {scanner_id} finished")
                     
             except Exception as e:
                 import traceback
                 error_msg = str(e)
                 traceback_str = traceback.format_exc()
-                self.root.after(0, lambda sid=scanner_id, msg=error_msg: self.log(f"Scanner {sid} error: {msg}"))
-                self.root.after(0, lambda: self.log(f"Traceback: {traceback_str}"))
+                self.queue_log(f"Scanner {scanner_id} error: {error_msg}")
+                self.queue_log(f"Traceback: {traceback_str}")
                 
                 with self.scanner_count_lock:
                     self.scanner_count -= 1
@@ -2616,14 +3609,26 @@ class FTPDownloaderGUI:
                         # Last scanner finished (even on error)
                         self.scanner_done = True
                         # Add poison pills to stop workers
-                        for _ in range(num_threads):
-                            self.download_queue.put(None)
+                        self.download_queue.put_many([None] * num_threads)
         
-        # Start multiple scanner threads (4 scanners for faster discovery)
+        # Start the scanner threads (count from the Number of Scanners setting)
         for i in range(num_scanners):
-            threading.Thread(target=scanner_thread, args=(i+1,), daemon=True).start()
+            start_io_thread(threading.Thread(target=scanner_thread, args=(i+1,), daemon=True))
             self.log(f"Scanner {i+1} started")
         
+        # Workers only exit once the last scanner's poison pills reach them, so
+        # the download is done when all of them have - nothing to poll for
+        workers = list(self.workers)
+        done_event = self.done_event
+        
+        def watch_workers():
+            for worker in workers:
+                worker.join()
+            done_event.set()
+            self.stats['dirty_event'].set()  # Wake update_progress from its idle poll
+        
+        threading.Thread(target=watch_workers, daemon=True).start()
+        
         self.is_downloading = True
         self.download_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -2658,16 +3663,16 @@ class FTPDownloaderGUI:
         # Reset stats
         with self.stats['lock']:
             self.stats['total'] = 0  # Will update as files are found
-            self.stats['completed'] = 0
-            self.stats['success'] = 0
-            self.stats['failed'] = 0
             self.stats['errors'] = []
+            self.stats['worker_counters'] = []
+            self.stats['speed_samples'] = collections.deque([(time.monotonic(), 0)])
         
         # Start worker threads
+        self.download_queue.resize(num_threads)
         self.workers = []
         for i in range(num_threads):
             worker = DownloadWorker(i, self.download_queue, self.stats, base_url,
-                                   local_dir, self.on_file_progress, self.update_file_status,
+                                   local_dir, self.on_file_progress, self.queue_file_status,
                                    username, password)
             worker.start()
             self.workers.append(worker)
@@ -2683,92 +3688,82 @@ class FTPDownloaderGUI:
         def scan_and_queue():
             try:
                 if use_tls:
-                    ftp = ftplib.FTP_TLS()
+                    ftp = TunedFTP_TLS()
                     ftp.connect(host, port)
                     ftp.login(username, password)
                     ftp.prot_p()
                 else:
-                    ftp = ftplib.FTP()
+                    ftp = TunedFTP()
                     ftp.connect(host, port)
                     if username or password:
                         ftp.login(username, password)
                 
-                def scan_with_queue(ftp, current_path, base_path):
-                    try:
-                        if current_path != '/':
-                            try:
-                                ftp.cwd(current_path)
-                            except:
-                                return
-                        
-                        items = []
+                local_prefix = os.path.join(local_dir, '')
+                
+                def scan_with_queue(ftp, base_path):
+                    # Iterative DFS with an explicit stack - deep trees can't
+                    # hit the recursion limit
+                    stack = [base_path]
+                    while stack:
+                        current_path = stack.pop()
                         try:
-                            for item in ftp.mlsd():
-                                items.append(item)
-                        except:
-                            lines = []
-                            ftp.retrlines('LIST', lines.append)
-                            for line in lines:
-                                parts = line.split()
-                                if len(parts) >= 9:
-                                    name = ' '.join(parts[8:])
-                                    is_dir = parts[0].startswith('d')
-                                    size = parts[4] if len(parts) > 4 else 'Unknown'
-                                    items.append((name, {'type': 'dir' if is_dir else 'file', 'size': size}))
-                        
-                        for name, info in items:
-                            if name in ['.', '..']:
-                                continue
-                            
-                            remote_path = os.path.join(current_path, name).replace('\\', '/')
-                            
-                            if info.get('type') == 'dir':
-                                scan_with_queue(ftp, remote_path, base_path)
+                            items = list_ftp_directory(ftp, current_path)
+                            subdirs = []
+                            prefix = current_path.rstrip('/') + '/'
+                            # Local directory for this listing, relative to remote_base
+                            if prefix.startswith(remote_base):
+                                rel_prefix = prefix[len(remote_base):].lstrip('/')
                             else:
-                                # Add to file list and queue immediately
-                                size = info.get('size', 'Unknown')
-                                self.file_list.append((remote_path, size))
-                                
-                                # Calculate local path and add to queue
-                                if remote_path.startswith(remote_base):
-                                    rel_path = remote_path[len(remote_base):].lstrip('/')
-                                else:
-                                    rel_path = remote_path.lstrip('/')
-                                
-                                local_path = os.path.join(local_dir, rel_path)
-                                self.download_queue.put((remote_path, local_path))
-                                # Track queued files
-                                with self.stats['lock']:
-                                    if 'queued_files' not in self.stats:
-                                        self.stats['queued_files'] = 0
-                                    self.stats['queued_files'] += 1
-                                
-                                # Update UI immediately
-                                self.root.after(0, lambda p=remote_path, s=size: self._add_file_to_treeview(p, s))
+                                rel_prefix = prefix.lstrip('/')
+                            local_dir_prefix = local_prefix + rel_prefix.replace('/', os.sep)
+                            
+                            for name, info in items:
+                                if name in ['.', '..']:
+                                    continue
                                 
-                                # Update stats
-                                with self.stats['lock']:
-                                    self.stats['total'] += 1
-                                    # Add file size to total size (parse size - could be string or int)
-                                    if isinstance(size, (int, float)):
-                                        size_bytes = int(size)
-                                    else:
-                                        size_bytes = self._parse_size(size)
-                                    self.stats['total_size'] += size_bytes
+                                remote_path = prefix + name
                                 
-                                if len(self.file_list) % 100 == 0:
-                                    count = len(self.file_list)
-                                    self.root.after(0, lambda c=count: self.log(f"Discovered {c} files, downloading in parallel..."))
-                    except Exception as e:
-                        self.root.after(0, lambda: self.log(f"Error scanning {current_path}: {str(e)}"))
+                                if info.get('type') == 'dir':
+                                    subdirs.append(remote_path)
+                                else:
+                                    # Add to file list and queue immediately
+                                    size = info.get('size', 'Unknown')
+                                    self.file_list.append((remote_path, size))
+                                    self.file_list_set.add(remote_path)
+                                    
+                                    # Calculate local path and add to queue
+                                    local_path = local_dir_prefix + name
+                                    size_bytes = self._parse_size(size)
+                                    self.download_queue.put((remote_path, local_path, size_bytes))
+                                    # Track queued files
+                                    with self.stats['lock']:
+                                        self.stats['queued_files'] += 1
+                                    
+                                    # No tree row until a worker starts on it
+                                    self.file_sizes[remote_path] = size
+                                    
+                                    # Update stats
+                                    with self.stats['lock']:
+                                        self.stats['total'] += 1
+                                        self.stats['total_size'] += size_bytes
+                                    self.stats['dirty_event'].set()
+                                    
+                                    if len(self.file_list) % 100 == 0:
+                                        count = len(self.file_list)
+                                        self.queue_log(f"Discovered {count} files, downloading in parallel...")
+                            
+                            # Pop subdirectories in listing order
+                            stack.extend(reversed(subdirs))
+                        except Exception as e:
+                            self.queue_log(f"Error scanning {current_path}: {str(e)}")
                 
-                scan_with_queue(ftp, remote_base, remote_base)
+                scan_with_queue(ftp, remote_base)
                 ftp.quit()
                 
-                self.root.after(0, lambda: self.log(f"Scan complete! Total files: {len(self.file_list)}"))
+                self.queue_log(f"Scan complete! Total files: {len(self.file_list)}")
                 
             except Exception as e:
-                self.root.after(0, lambda: self.log(f"Scan error: {str(e)}"))
+                self.queue_log(f"Scan error: {str(e)}")
         
         threading.Thread(target=scan_and_queue, daemon=True).start()
         
@@ -2780,47 +3775,46 @@ class FTPDownloaderGUI:
         if not self.is_downloading:
             return
         
+        # Skip the recompute unless a worker/scanner changed the stats, or the
+        # speed window has elapsed (so the speed decays to 0 while idle).
+        # Monotonic, so wall-clock adjustments can't skew the speed window
+        current_time = time.monotonic()
+        stats_dirty = self.stats['dirty_event']
+        if not stats_dirty.is_set() and current_time - self.last_progress_update < SPEED_WINDOW:
+            # Nothing changed - poll less often until something does
+            self.root.after(PROGRESS_IDLE_POLL_MS, self.update_progress)
+            return
+        stats_dirty.clear()
+        self.last_progress_update = current_time
+        
+        # Worker counts first: they only grow, and a file is counted in total
+        # before any worker can finish it, so completed never passes total
+        completed, failed = self._file_counts()
+        # One snapshot under the lock - all formatting and Tk calls below run without it
         with self.stats['lock']:
             total = self.stats['total']
-            completed = self.stats['completed']
-            success = self.stats['success']
-            failed = self.stats['failed']
-        
-        # Progress bar removed - stats are shown in the Statistics frame
+            total_size = self.stats.get('total_size', 0)
+            error_count = len(self.stats['errors'])
+        bytes_downloaded = self._bytes_downloaded()
         
-        # Calculate and display speed (even during scan)
-        current_time = time.time()
+        # Speed over a sliding window, recomputed every redraw instead of
+        # jumping every 2 seconds. The samples are only touched here on the
+        # Tk thread - no lock needed
         speed = 0.0
-        speed_str = "0 B/s"
+        samples = self.stats['speed_samples']
+        if samples is not None:
+            samples.append((current_time, bytes_downloaded))
+            # Keep one sample at least SPEED_WINDOW old as the baseline
+            while len(samples) > 2 and current_time - samples[1][0] >= SPEED_WINDOW:
+                samples.popleft()
+            start_time, start_bytes = samples[0]
+            if current_time > start_time:
+                speed = (bytes_downloaded - start_bytes) / (current_time - start_time)
         
-        with self.stats['lock']:
-            bytes_downloaded = self.stats.get('bytes_downloaded', 0)
-            last_bytes = self.stats.get('last_bytes', 0)
-            last_speed_time = self.stats.get('last_speed_time')
-            
-            if last_speed_time is not None:
-                time_diff = current_time - last_speed_time
-                if time_diff >= 2.0:
-                    bytes_diff = bytes_downloaded - last_bytes
-                    speed = bytes_diff / time_diff if time_diff > 0 else 0
-                    self.stats['current_speed'] = speed
-                    self.stats['last_bytes'] = bytes_downloaded
-                    self.stats['last_speed_time'] = current_time
-                else:
-                    speed = self.stats.get('current_speed', 0)
+        # Progress bar removed - stats are shown in the Statistics frame
         
-        # Format speed
-        if speed >= 1024 * 1024:
-            speed_str = f"{speed / (1024 * 1024):.1f} MB/s"
-        elif speed >= 1024:
-            speed_str = f"{speed / 1024:.1f} KB/s"
-        else:
-            speed_str = f"{speed:.0f} B/s"
+        speed_str = format_speed(speed)
         
-        # Get total size and format it
-        with self.stats['lock']:
-            total_size = self.stats.get('total_size', 0)
-            bytes_downloaded = self.stats.get('bytes_downloaded', 0)
         total_size_str = self._format_size(total_size) if total_size > 0 else "Unknown"
         
         # Calculate progress percentage
@@ -2846,27 +3840,34 @@ class FTPDownloaderGUI:
         
         # Calculate pending files (total - completed - failed)
         pending = max(0, total - completed - failed)
-        self.stats_var.set(f"Files: {total} | Total Size: {total_size_str} | Progress: {progress_str} | ETA: {eta_str} | Completed: {completed} | Pending: {pending} | Failed: {failed} | Speed: {speed_str}")
+        self._set_stats_text(STATS_TEMPLATE.format(
+            total=total, total_size=total_size_str, progress=progress_str, eta=eta_str,
+            completed=completed, pending=pending, failed=failed, speed=speed_str))
         
-        # Check if done
-        if completed >= total and total > 0:
+        # Done once every worker has exited (see watch_workers in _start_parallel_downloads)
+        if self.done_event.is_set():
             self.is_downloading = False
             self.download_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
             self.test_connection_button.config(state=tk.NORMAL)
             
-            with self.stats['lock']:
-                errors = self.stats['errors']
-            
-            if errors:
-                self.log(f"Download complete with {len(errors)} errors")
+            if error_count:
+                self.log(f"Download complete with {error_count} errors")
             else:
                 self.log("Download complete!")
             
-            messagebox.showinfo("Complete", f"Download finished!\nCompleted: {completed}\nFailed: {failed}")
+            # Only announce once
+            if not self.completion_dialog_shown:
+                self.completion_dialog_shown = True
+                self._show_tray_notification(
+                    "Download Complete",
+                    f"Completed: {completed}, Failed: {failed}",
+                    duration=10
+                )
+                self.status_var.set(f"Download finished - Completed: {completed}, Failed: {failed}")
         else:
-            # Schedule next update
-            self.root.after(500, self.update_progress)
+            # Schedule next poll
+            self.root.after(PROGRESS_POLL_MS, self.update_progress)
     
     def _start_recursive_wget_download(self):
         """Start recursive download using wget's built-in recursive mode"""
@@ -2919,36 +3920,52 @@ class FTPDownloaderGUI:
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
+                    bufsize=0
                 )
                 
                 self.download_process = process
                 
-                for line in process.stdout:
+                # Read wget's output in raw chunks rather than line by line - the
+                # progress bar redraws many times a second. The log drain already
+                # batches what's queued here into one Text insert per poll
+                fd = process.stdout.fileno()
+                pending = b''
+                while True:
+                    # Returns as soon as anything is in the pipe, up to 64 KB
+                    chunk = os.read(fd, 65536)
                     if not self.is_downloading:
                         process.terminate()
                         break
-                    if line.strip():
-                        self.root.after(0, lambda l=line.strip(): self.log(l))
+                    if not chunk:
+                        break  # wget closed its output
+                    # Progress bar redraws end in \r, everything else in \n
+                    lines = (pending + chunk).replace(b'\r', b'\n').split(b'\n')
+                    pending = lines.pop()
+                    for line in lines:
+                        line = line.strip()
+                        if line:
+                            self.queue_log(line.decode(errors='replace'))
+                if pending.strip():
+                    self.queue_log(pending.strip().decode(errors='replace'))
                 
                 return_code = process.wait()
                 
                 if return_code == 0:
-                    self.root.after(0, lambda: self.log("Recursive download complete!"))
-                    self.root.after(0, lambda: messagebox.showinfo("Complete", "Download finished successfully!"))
+                    self.queue_log("Recursive download complete!")
+                    self.root.after(0, lambda: self.status_var.set("Download finished successfully"))
                 else:
-                    self.root.after(0, lambda: self.log(f"Download finished with return code {return_code}"))
-                    self.root.after(0, lambda: messagebox.showwarning("Warning", f"Download finished with return code {return_code}"))
+                    self.queue_log(f"Download finished with return code {return_code}")
+                    self.root.after(0, lambda: self.status_var.set(f"Download finished with return code {return_code}"))
                 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda msg=error_msg: self.log(f"Error: {msg}"))
+                self.queue_log(f"Error: {error_msg}")
                 self.root.after(0, lambda msg=error_msg: messagebox.showerror("Error", f"Download failed: {msg}"))
             finally:
                 self.root.after(0, self._download_finished)
         
         self.is_downloading = True
+        self.status_var.set("")
         self.download_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.test_connection_button.config(state=tk.DISABLED)
@@ -2963,6 +3980,24 @@ class FTPDownloaderGUI:
         self.test_connection_button.config(state=tk.NORMAL)
         self.download_process = None
     
+    def _set_stats_text(self, text):
+        """Show text on the Statistics line, skipping the Tk round-trip when it's unchanged"""
+        if text != self._last_stats_str:
+            self._last_stats_str = text
+            self.stats_var.set(text)
+    
+    def _bytes_downloaded(self):
+        """Bytes downloaded this session, summed from the workers' own counters"""
+        return sum(worker.bytes_downloaded for worker in self.stats['worker_counters'])
+    
+    def _file_counts(self):
+        """(completed, failed) file counts this session, summed from the workers' own counters"""
+        succeeded = failed = 0
+        for worker in self.stats['worker_counters']:
+            succeeded += worker.files_succeeded
+            failed += worker.files_failed
+        return succeeded + failed, failed
+    
     def on_file_progress(self, worker_id, remote_path, percent):
         """Callback for file download progress"""
         # Progress bar removed - file status is shown in the treeview
@@ -2981,42 +4016,12 @@ class FTPDownloaderGUI:
     
     def _parse_size(self, size):
         """Parse file size from various formats (int, string, etc.) and return bytes"""
-        if isinstance(size, int):
-            return size
-        if isinstance(size, str):
-            if size == 'Unknown' or size == '':
-                return 0
-            # Try to parse as integer
-            try:
-                return int(size)
-            except ValueError:
-                return 0
-        return 0
+        return _SIZE_PARSERS.get(type(size), _parse_size_unknown)(size)
     
     def stop_download(self):
         """Stop downloading"""
         self.is_downloading = False
         
-        # Stop all workers
-        for worker in self.workers:
-            worker.stop()
-        
-        # Wait for workers to finish
-        for worker in self.workers:
-            worker.join(timeout=2)
-        
-        # Re-enable buttons
-        self.download_button.config(state=tk.NORMAL)
-        self.stop_button.config(state=tk.DISABLED)
-        self.test_connection_button.config(state=tk.NORMAL)
-        # Enable retry button if there are failed downloads
-        if self.failed_downloads_dict:
-            self.retry_failed_button.config(state=tk.NORMAL)
-        else:
-            self.retry_failed_button.config(state=tk.DISABLED)
-        
-        self.log("Download stopped by user")
-        
         # Stop wget process if running (legacy code, may not be needed)
         if self.download_process:
             try:
@@ -3024,22 +4029,40 @@ class FTPDownloaderGUI:
             except:
                 pass
         
-        # Stop all workers
+        # Stop all workers, end the files they're in the middle of, and wake
+        # any that are blocked on queue.get()
         for worker in self.workers:
             worker.stop()
-            self.download_queue.put(None)  # Poison pill
+            worker.abort_transfers()
+        self.download_queue.put_many([None] * len(self.workers))  # Poison pills
+        
+        # Drop pending directories so scanners stop picking up new work
+        if self.dir_queue is not None:
+            self.dir_queue.clear()
+        
+        # Wait for workers to finish - one shared budget, not STOP_JOIN_TIMEOUT per worker
+        deadline = time.monotonic() + STOP_JOIN_TIMEOUT
+        for worker in self.workers:
+            worker.join(timeout=max(0, deadline - time.monotonic()))
         
-        # Wait for workers to finish
+        # Workers still alive are stuck in a socket read - force it to fail
         for worker in self.workers:
-            worker.join(timeout=2)
+            if worker.is_alive():
+                worker.abort()
         
         self.workers = []
         
+        # Re-enable buttons
         self.download_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.test_connection_button.config(state=tk.NORMAL)
+        # Enable retry button if there are failed downloads
+        if self.failed_downloads_dict:
+            self.retry_failed_button.config(state=tk.NORMAL)
+        else:
+            self.retry_failed_button.config(state=tk.DISABLED)
         
-        self.log("Download stopped")
+        self.log("Download stopped by user")
 
 
 def main():